@@ -688,8 +688,12 @@ def run_selfplay_until_end(
         )
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point.
+
+    ``argv`` defaults to ``sys.argv[1:]``; passing it lets tests and other
+    callers run commands in-process. Returns the process exit status.
+    """
     parser = argparse.ArgumentParser(description="Zyra Chess Engine CLI")
     parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -766,7 +770,7 @@ def main() -> None:
         help="Animation frame delay in ms (also pause between frames)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Initialize seed if provided
     if args.seed is not None:
@@ -823,7 +827,8 @@ def main() -> None:
         )
     else:
         parser.print_help()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -6,11 +6,27 @@ chess position handling and state management.
 
 from __future__ import annotations
 
+import functools
 from typing import List, Optional
 
+from .zobrist import zobrist_hash
+
 FILES = "abcdefgh"
 RANKS = "12345678"
 
+# The 64 on-board 0x88 indices in ascending order; whole-board scans iterate
+# these instead of all 128 slots with an off-board test per index
+BOARD_SQUARES = tuple(idx for idx in range(128) if (idx & 0x88) == 0)
+
+# FEN digits expanded to runs of empty squares, applied with str.translate
+_FEN_EMPTY_RUNS = str.maketrans({str(n): "\u0000" * n for n in range(10)})
+
+# The reverse for to_fen: runs of empty squares, longest first, with their digit
+_FEN_EMPTY_DIGITS = tuple(("\u0000" * n, str(n)) for n in range(8, 0, -1))
+
+# 0x88 index of the a-file square of each rank, top (rank 8) first
+_RANK_STARTS = tuple(range(0, 128, 16))
+
 
 def square_to_index(square: str) -> int:
     """Convert algebraic square like 'e4' to 0x88 index.
@@ -32,7 +48,12 @@ def index_to_square(index: int) -> str:
 
 
 class Board:
-    """Represents a chess board with 0x88 mailbox representation."""
+    """Represents a chess board with 0x88 mailbox representation.
+
+    ``zobrist`` holds the position's Zobrist hash. ``load_fen``, ``make_move``
+    and ``unmake_move`` keep it current; code that edits ``squares`` or other
+    state directly must refresh it with ``core.zobrist.zobrist_hash``.
+    """
 
     def __init__(self) -> None:
         """Initialize an empty board and default state."""
@@ -43,6 +64,7 @@ class Board:
         self.ep_square: Optional[int] = None
         self.halfmove_clock: int = 0
         self.fullmove_number: int = 1
+        self.zobrist: int = zobrist_hash(self)
 
     # -------------------- FEN Handling --------------------
     def load_fen(self, fen: str) -> None:
@@ -61,53 +83,36 @@ class Board:
         self.halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
         self.fullmove_number = int(fields[5]) if len(fields) > 5 else 1
 
-        # Reset board
-        for i in range(128):
-            if (i & 0x88) == 0:
-                self.squares[i] = "\u0000"
-
         ranks = placement.split("/")
         if len(ranks) != 8:
             raise ValueError("Invalid FEN: expected 8 ranks")
 
+        # Expand each rank to its squares in one translate and write it as a
+        # slice; ranks are 16-index rows in 0x88, with files at the row start
+        squares = self.squares
         for rank_idx_from_top, rank in enumerate(ranks):
-            file_idx = 0
-            for ch in rank:
-                if ch.isdigit():
-                    file_idx += int(ch)
-                else:
-                    idx = (rank_idx_from_top << 4) | file_idx
-                    if (idx & 0x88) != 0:
-                        raise ValueError("Invalid square index while parsing FEN")
-                    self.squares[idx] = ch
-                    file_idx += 1
+            row = rank.translate(_FEN_EMPTY_RUNS)
+            if len(row) > 8:
+                raise ValueError("Invalid square index while parsing FEN")
+            start = rank_idx_from_top << 4
+            squares[start : start + 8] = row.ljust(8, "\u0000")
 
         if ep_field == "-":
             self.ep_square = None
         else:
             self.ep_square = square_to_index(ep_field)
 
+        self.zobrist = zobrist_hash(self)
+
     def to_fen(self) -> str:
         """Convert current position to FEN notation."""
-        rank_strs: List[str] = []
-        for rank_idx_from_top in range(8):
-            empties = 0
-            parts: List[str] = []
-            for file_idx in range(8):
-                idx = (rank_idx_from_top << 4) | file_idx
-                piece = self.squares[idx]
-                if piece == "\u0000":
-                    empties += 1
-                else:
-                    if empties:
-                        parts.append(str(empties))
-                        empties = 0
-                    parts.append(piece)
-            if empties:
-                parts.append(str(empties))
-            rank_strs.append("".join(parts))
-
-        placement = "/".join(rank_strs)
+        # Each rank is a contiguous 8-slot row in 0x88: join the rows, then
+        # collapse empty runs (longest first) into digits; runs never span a "/"
+        squares = self.squares
+        placement = "/".join("".join(squares[start : start + 8]) for start in _RANK_STARTS)
+        for run, digit in _FEN_EMPTY_DIGITS:
+            placement = placement.replace(run, digit)
+
         side = self.side_to_move
         castling = self.castling if self.castling != "" else "-"
         ep = index_to_square(self.ep_square) if self.ep_square is not None else "-"
@@ -118,6 +123,26 @@ class Board:
         """Load the standard chess starting position."""
         self.load_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
 
+    @classmethod
+    def empty(cls) -> "Board":
+        """Allocate a board without running ``__init__``.
+
+        Every field is left unset; callers must assign all of them.
+        """
+        return cls.__new__(cls)
+
+    def clone(self) -> "Board":
+        """Return an independent copy, skipping the default initialization."""
+        board = Board.empty()
+        board.squares = self.squares.copy()
+        board.side_to_move = self.side_to_move
+        board.castling = self.castling
+        board.ep_square = self.ep_square
+        board.halfmove_clock = self.halfmove_clock
+        board.fullmove_number = self.fullmove_number
+        board.zobrist = self.zobrist
+        return board
+
     def copy_from(self, other: "Board") -> None:
         """Copy state from another board."""
         self.squares = other.squares.copy()
@@ -126,3 +151,22 @@ class Board:
         self.ep_square = other.ep_square
         self.halfmove_clock = other.halfmove_clock
         self.fullmove_number = other.fullmove_number
+        self.zobrist = other.zobrist
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_fen(fen: str) -> Board:
+    """Parse ``fen`` into a board kept as a read-only template."""
+    board = Board()
+    board.load_fen(fen)
+    return board
+
+
+def board_from_fen(fen: str) -> Board:
+    """Return a new board set to ``fen``.
+
+    Each distinct FEN is parsed once; later calls clone the parsed board, so
+    the result is independent and may be mutated freely. Invalid FENs raise
+    ``ValueError`` as ``load_fen`` does and are not cached.
+    """
+    return _parse_fen(fen).clone()
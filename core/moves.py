@@ -7,7 +7,10 @@ handled minimally where straightforward; full correctness will evolve with
 later tasks.
 """
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from .board import BOARD_SQUARES
+from .zobrist import zobrist_move_delta
 
 # Offsets for piece movement in 0x88 representation
 KNIGHT_OFFSETS = [31, 33, 14, 18, -31, -33, -14, -18]
@@ -16,10 +19,27 @@ ROOK_DIRECTIONS = [16, -16, 1, -1]
 QUEEN_DIRECTIONS = BISHOP_DIRECTIONS + ROOK_DIRECTIONS
 KING_OFFSETS = [1, -1, 16, -16, 15, 17, -15, -17]
 
+# Maximum number of positions kept in the legal-move cache (oldest evicted);
+# an entry is a few KB, so this bounds the cache at roughly 20 MB
+MOVE_CACHE_SIZE = 1 << 12
+
+# Legal moves by Zobrist key. The key covers pieces, side to move, castling
+# rights and en passant, everything legality depends on. Code that edits a
+# board's fields directly must keep board.zobrist in step or it reads stale moves
+_MOVE_CACHE: Dict[int, Tuple["Move", ...]] = {}
+
+
+def clear_move_cache() -> None:
+    """Drop all memoized legal-move lists."""
+    _MOVE_CACHE.clear()
+
 
 class Move:
     """Represents a chess move."""
 
+    # Built by the thousand in move generation; slots drop the per-move dict
+    __slots__ = ("from_square", "to_square", "promotion")
+
     def __init__(self, from_square: int, to_square: int, promotion: Optional[str] = None) -> None:
         self.from_square = from_square
         self.to_square = to_square
@@ -63,9 +83,7 @@ def _generate_pseudolegal(board: Any) -> List[Move]:
     moves: List[Move] = []
     side_white = board.side_to_move == "w"
 
-    for from_sq in range(128):
-        if _is_offboard(from_sq):
-            continue
+    for from_sq in BOARD_SQUARES:
         piece = board.squares[from_sq]
         if piece == "\u0000":
             continue
@@ -197,9 +215,7 @@ def _append_pawn_move_with_promo(
 
 def _locate_king(board: Any, white: bool) -> Optional[int]:
     target = "K" if white else "k"
-    for i in range(128):
-        if _is_offboard(i):
-            continue
+    for i in BOARD_SQUARES:
         if board.squares[i] == target:
             return i
     return None
@@ -270,6 +286,8 @@ def _make_move(board: Any, move: Move) -> Tuple[str, Optional[int], Optional[str
 
     Handles castling, en passant, and promotion.
     """
+    # Side to move is fixed until the flip at the end; compared once
+    white = board.side_to_move == "w"
     captured = board.squares[move.to_square]
     rook_from_sq = None
     halfmove_prev = board.halfmove_clock
@@ -299,9 +317,9 @@ def _make_move(board: Any, move: Move) -> Tuple[str, Optional[int], Optional[str
         # Remove the captured pawn (behind the destination square)
         # White capture removes pawn at to+16 (one rank behind from white's perspective)
         # Black capture removes pawn at to-16
-        ep_capture_sq = move.to_square + (16 if board.side_to_move == "w" else -16)
+        ep_capture_sq = move.to_square + (16 if white else -16)
         board.squares[ep_capture_sq] = "\u0000"
-        captured = "P" if board.side_to_move == "b" else "p"  # The captured pawn
+        captured = "p" if white else "P"  # The captured pawn
 
     # Regular move
     board.squares[move.to_square] = moved_piece
@@ -310,7 +328,7 @@ def _make_move(board: Any, move: Move) -> Tuple[str, Optional[int], Optional[str
     # Handle promotion (replace pawn with promoted piece of correct color)
     if move.promotion and move.promotion not in ["O-O", "O-O-O"]:
         promoted = move.promotion
-        if board.side_to_move == "w":
+        if white:
             board.squares[move.to_square] = promoted.upper()
         else:
             board.squares[move.to_square] = promoted.lower()
@@ -319,17 +337,9 @@ def _make_move(board: Any, move: Move) -> Tuple[str, Optional[int], Optional[str
 
     # Set en passant square for double pawn pushes
     if moved_piece.lower() == "p":
-        if (
-            board.side_to_move == "w"
-            and (move.from_square >> 4) == 6
-            and (move.to_square >> 4) == 4
-        ):
+        if white and (move.from_square >> 4) == 6 and (move.to_square >> 4) == 4:
             board.ep_square = move.to_square + 16  # Behind the pawn
-        elif (
-            board.side_to_move == "b"
-            and (move.from_square >> 4) == 1
-            and (move.to_square >> 4) == 3
-        ):
+        elif not white and (move.from_square >> 4) == 1 and (move.to_square >> 4) == 3:
             board.ep_square = move.to_square - 16  # Behind the pawn
         else:
             board.ep_square = None  # Not a double pawn push
@@ -342,11 +352,11 @@ def _make_move(board: Any, move: Move) -> Tuple[str, Optional[int], Optional[str
     else:
         board.halfmove_clock += 1
 
-    if board.side_to_move == "b":  # After white's move
+    if not white:  # After black's move
         board.fullmove_number += 1
 
     # flip side to move
-    board.side_to_move = "b" if board.side_to_move == "w" else "w"
+    board.side_to_move = "b" if white else "w"
     return captured, ep_prev, rook_from_sq, halfmove_prev, fullmove_prev
 
 
@@ -360,8 +370,9 @@ def _unmake_move(
     halfmove_prev: Optional[int] = None,
     fullmove_prev: Optional[int] = None,
 ) -> None:
-    # flip back side
-    board.side_to_move = "b" if board.side_to_move == "w" else "w"
+    # flip back side; `white` is the side that made the move
+    white = board.side_to_move == "b"
+    board.side_to_move = "w" if white else "b"
 
     # Handle castling unmake
     if move.promotion == "O-O":  # Kingside castling
@@ -386,14 +397,16 @@ def _unmake_move(
     ):
         # Restore the captured pawn one square behind the destination
         # Relative to the side that originally moved (current side_to_move after flip)
-        ep_capture_sq = move.to_square + (16 if board.side_to_move == "w" else -16)
+        ep_capture_sq = move.to_square + (16 if white else -16)
         board.squares[ep_capture_sq] = captured
+        # The destination square was empty before an en-passant capture
+        captured = "\u0000"
 
     # Regular move unmake
     piece = board.squares[move.to_square]
     if move.promotion and move.promotion not in ["O-O", "O-O-O"]:
         # Restore pawn color according to side that originally moved
-        if board.side_to_move == "w":
+        if white:
             piece = "P"
         else:
             piece = "p"
@@ -409,19 +422,39 @@ def _unmake_move(
 
 
 def generate_moves(board: Any) -> List[Move]:
-    """Generate all legal moves for the current position."""
+    """Generate all legal moves for the current position.
+
+    Results are memoized by ``board.zobrist``; each call returns a fresh list,
+    so callers may reorder or pop from it without affecting the cache.
+    """
     if board is None:
         return []
+    key = getattr(board, "zobrist", None)
+    if key is None:
+        return _generate_legal_moves(board)
+    cached = _MOVE_CACHE.get(key)
+    if cached is None:
+        cached = tuple(_generate_legal_moves(board))
+        if len(_MOVE_CACHE) >= MOVE_CACHE_SIZE:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            del _MOVE_CACHE[next(iter(_MOVE_CACHE))]
+        _MOVE_CACHE[key] = cached
+    return list(cached)
+
+
+def _generate_legal_moves(board: Any) -> List[Move]:
+    """Generate legal moves by filtering pseudolegal moves that leave the king in check."""
     legal: List[Move] = []
+    # Each trial move is unmade before the next, so the mover never changes
+    mover_white = board.side_to_move == "w"
     for mv in _generate_pseudolegal(board):
         moved_piece = board.squares[mv.from_square]
         captured, ep_prev, rook_from_sq, halfmove_prev, fullmove_prev = _make_move(board, mv)
-        king_sq = _locate_king(
-            board, white=(board.side_to_move == "b")
-        )  # after move, opponent to move
+        # After the move the opponent is to move; test the mover's king
+        king_sq = _locate_king(board, white=mover_white)
         in_check = False
         if king_sq is not None:
-            in_check = _square_attacked_by(board, king_sq, by_white=(board.side_to_move == "w"))
+            in_check = _square_attacked_by(board, king_sq, by_white=not mover_white)
         _unmake_move(
             board,
             mv,
@@ -467,9 +500,11 @@ def make_move(
     """Public make move that returns data needed for unmake.
 
     Returns (captured_piece, ep_prev, moved_piece, rook_from_sq, halfmove_prev, fullmove_prev).
+    Updates ``board.zobrist`` incrementally.
     """
     moved_piece = board.squares[move.from_square]
     captured, ep_prev, rook_from_sq, halfmove_prev, fullmove_prev = _make_move(board, move)
+    board.zobrist ^= zobrist_move_delta(board, move, captured, ep_prev, moved_piece)
     return captured, ep_prev, moved_piece, rook_from_sq, halfmove_prev, fullmove_prev
 
 
@@ -483,6 +518,9 @@ def unmake_move(
     halfmove_prev: int,
     fullmove_prev: int,
 ) -> None:
+    """Public unmake move; reverses ``make_move`` including ``board.zobrist``."""
+    # The delta is computed from the post-move state, before it is undone
+    board.zobrist ^= zobrist_move_delta(board, move, captured, ep_prev, moved_piece)
     _unmake_move(
         board,
         move,
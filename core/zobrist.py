@@ -6,9 +6,10 @@ Provides a reproducible position hash for use with transposition tables.
 from __future__ import annotations
 
 import random
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List
 
-from .board import Board
+if TYPE_CHECKING:
+    from .board import Board
 
 # Piece set for hashing
 _PIECES = "PNBRQKpnbrqk"
@@ -24,6 +25,8 @@ class ZobristTable:
         self.piece_square: Dict[str, List[int]] = {
             p: [rng.getrandbits(64) for _ in range(128)] for p in _PIECES
         }
+        # Empty squares hash to 0, so move deltas can index any square's content
+        self.piece_square["\u0000"] = [0] * 128
         self.side_to_move: int = rng.getrandbits(64)
 
         # Castling rights bits for characters in FEN castling field
@@ -65,16 +68,58 @@ class ZobristTable:
 
         return h
 
+    def move_delta(self, board: Board, move, captured: str, ep_prev, moved_piece: str) -> int:
+        """XOR delta between the hashes before and after ``move``.
+
+        Evaluated on the board *after* the move, with the undo data returned
+        by ``make_move``; the same delta applies before ``unmake_move``, since
+        XOR is its own inverse.
+        """
+        piece_square = self.piece_square
+        from_sq = move.from_square
+        to_sq = move.to_square
+
+        # Mover leaves its origin; the (possibly promoted) piece lands on the target
+        h = piece_square[moved_piece][from_sq]
+        h ^= piece_square[board.squares[to_sq]][to_sq]
+
+        if captured != "\u0000":
+            if moved_piece in "Pp" and ep_prev is not None and to_sq == ep_prev:
+                # En passant: the captured pawn sat behind the target square
+                h ^= piece_square[captured][to_sq + (16 if moved_piece == "P" else -16)]
+            else:
+                h ^= piece_square[captured][to_sq]
+
+        if move.promotion == "O-O":
+            rook = board.squares[from_sq + 1]
+            h ^= piece_square[rook][from_sq + 3] ^ piece_square[rook][from_sq + 1]
+        elif move.promotion == "O-O-O":
+            rook = board.squares[from_sq - 1]
+            h ^= piece_square[rook][from_sq - 4] ^ piece_square[rook][from_sq - 1]
+
+        # Side to move always flips; en-passant file may change
+        h ^= self.side_to_move
+        if ep_prev is not None:
+            h ^= self.ep_file[ep_prev & 0x7]
+        if board.ep_square is not None:
+            h ^= self.ep_file[board.ep_square & 0x7]
+        return h
+
 
-_GLOBAL_ZOBRIST: Optional[ZobristTable] = None
+# Built at import so the first search does not pay for key generation and
+# the hot hash path carries no lazy-initialization check
+_GLOBAL_ZOBRIST: ZobristTable = ZobristTable()
 
 
 def zobrist_hash(board: Board) -> int:
     """Compute Zobrist hash for the given board using a global table.
 
-    The table is initialized deterministically on first use.
+    The table is initialized deterministically at import time. This is a full
+    recompute; ``Board.zobrist`` carries the same value incrementally.
     """
-    global _GLOBAL_ZOBRIST
-    if _GLOBAL_ZOBRIST is None:
-        _GLOBAL_ZOBRIST = ZobristTable()
     return _GLOBAL_ZOBRIST.hash_board(board)
+
+
+def zobrist_move_delta(board: Board, move, captured: str, ep_prev, moved_piece: str) -> int:
+    """Return the XOR delta a move applies to the hash (see ``ZobristTable.move_delta``)."""
+    return _GLOBAL_ZOBRIST.move_delta(board, move, captured, ep_prev, moved_piece)
@@ -6,8 +6,11 @@ positional factors, and style-based weights.
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from core.board import BOARD_SQUARES
+
 # -------------------- Utility Data --------------------
 PIECE_VALUES: Dict[str, int] = {
     "p": 100,
@@ -62,7 +65,12 @@ class EvaluationResult:
 
 
 class Evaluation:
-    """Chess position evaluator with explainable heuristics."""
+    """Chess position evaluator with explainable heuristics.
+
+    Scores depend only on the position and the style weights; the debug log
+    buffer is reset by each evaluation, so one instance can be shared across
+    positions.
+    """
 
     def __init__(
         self,
@@ -162,9 +170,7 @@ class Evaluation:
     # -------------------- Term Scorers --------------------
     def _score_material(self, position: Any) -> int:
         score = 0
-        for idx in range(128):
-            if _is_offboard(idx):
-                continue
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece == "\u0000":
                 continue
@@ -184,9 +190,7 @@ class Evaluation:
         from core.moves import _square_attacked_by  # type: ignore
 
         bonus = 0
-        for idx in range(128):
-            if _is_offboard(idx):
-                continue
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece == "\u0000" or piece.lower() == "k":
                 continue
@@ -255,9 +259,7 @@ class Evaluation:
         from core.moves import _square_attacked_by  # type: ignore
 
         penalty = 0
-        for idx in range(128):
-            if _is_offboard(idx):
-                continue
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece == "\u0000" or piece.lower() == "k":
                 continue
@@ -293,9 +295,7 @@ class Evaluation:
         enemy targets and grant a small bonus.
         """
         bonus = 0
-        for idx in range(128):
-            if _is_offboard(idx):
-                continue
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece == "\u0000" or piece.lower() == "k":
                 continue
@@ -368,9 +368,7 @@ class Evaluation:
     def _score_rook_files(self, position: Any) -> int:
         # Bonus for rooks on open/semi-open files (no friendly/all pawns on file)
         score = 0
-        for idx in range(128):
-            if _is_offboard(idx):
-                continue
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece.lower() != "r":
                 continue
@@ -402,15 +400,25 @@ class Evaluation:
     def _score_mobility(self, position: Any) -> int:
         # Simple mobility: number of legal moves difference
         from core.moves import generate_moves
+        from core.zobrist import zobrist_hash
 
-        # Count white mobility
         original_side = position.side_to_move
-        position.side_to_move = "w"
-        white_moves = len(generate_moves(position))
-        position.side_to_move = "b"
-        black_moves = len(generate_moves(position))
+        original_ep = position.ep_square
+        original_key = position.zobrist
+
+        counts: Dict[str, int] = {}
+        for side in ("w", "b"):
+            position.side_to_move = side
+            # Only the side to move may capture en passant; generate_moves is
+            # memoized by hash, so the edited position must be rehashed
+            position.ep_square = original_ep if side == original_side else None
+            position.zobrist = zobrist_hash(position)
+            counts[side] = len(generate_moves(position))
+
         position.side_to_move = original_side
-        return white_moves - black_moves
+        position.ep_square = original_ep
+        position.zobrist = original_key
+        return counts["w"] - counts["b"]
 
     def _score_king_safety(self, position: Any) -> int:
         # Basic king safety: pawn shield in front of king gets small bonus
@@ -447,11 +455,38 @@ class Evaluation:
         return score
 
 
+class _FrozenWeights(dict):
+    """Read-only, hashable weights dict shared by cached style profiles.
+
+    Still a ``dict`` for callers and JSON encoders; ``dict(...)`` or ``copy()``
+    gives a mutable copy.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("style profile weights are read-only; copy them to modify")
+
+    __setitem__ = __delitem__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+    __ior__ = _readonly  # type: ignore[assignment]
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, float]]]:
+        # Rebuild from a plain dict; the default dict pickling calls __setitem__
+        return (_FrozenWeights, (dict(self),))
+
+
+# Bounded: profile names can come from clients (e.g. the web API), and
+# unknown names would otherwise each stay cached for the life of the process
+@functools.lru_cache(maxsize=16)
 def get_style_profile(profile_name: str) -> Dict[str, float]:
     """Get predefined style profile weights.
 
     Weights apply multiplicatively to evaluation terms.
     Known terms: material, attacking_motifs, center_control, rook_files, mobility, king_safety, initiative
+
+    Results are cached per name and shared, so they are read-only.
     """
     profiles: Dict[str, Dict[str, float]] = {
         "aggressive": {
@@ -482,7 +517,7 @@ def get_style_profile(profile_name: str) -> Dict[str, float]:
             "initiative": 1.1,
         },
     }
-    return profiles.get(profile_name, {})
+    return _FrozenWeights(profiles.get(profile_name, {}))
 
 
 def parse_style_config(config: Optional[Dict[str, float] or str]) -> Dict[str, float]:
@@ -533,11 +568,31 @@ def _noop(_: str) -> None:
     return None
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_style_weights(style_key: Tuple[Tuple[str, Any], ...]) -> Dict[str, float]:
+    """Validated, read-only weights for sorted ``(term, weight)`` items."""
+    return _FrozenWeights(validate_style_weights(dict(style_key)))
+
+
 def create_evaluator(
     style: Optional[Dict[str, float] or str] = None, logger: Optional[Callable[[str], None]] = None
 ) -> Evaluation:
-    """Factory to create an Evaluation with parsed style and optional logger."""
-    lw = parse_style_config(style)
+    """Factory to create an Evaluation with parsed style and optional logger.
+
+    Weights dicts are validated once per distinct set of items and shared
+    read-only like named profiles, so repeated styles reuse one cached weight
+    vector. Each call still builds a new evaluator: evaluators own a position
+    cache, a log buffer and a settable style, which must not leak between
+    callers.
+    """
+    if isinstance(style, dict):
+        try:
+            lw = _cached_style_weights(tuple(sorted(style.items())))
+        except TypeError:
+            # Unhashable weights or unsortable keys; validate uncached
+            lw = parse_style_config(style)
+    else:
+        lw = parse_style_config(style)
     return Evaluation(style_weights=lw, logger=logger or _noop)
 
 
@@ -8,13 +8,25 @@ from __future__ import annotations
 
 import time
 from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from core.board import BOARD_SQUARES
 from performance.profiler import ProfilerContext, profile_function, profile_method
 
 # Optimized piece values with fast lookup
 PIECE_VALUES_OPTIMIZED = {"p": 100, "n": 320, "b": 330, "r": 500, "q": 900, "k": 0}
 
+# Evaluation terms, in the order of the feature vector returned by
+# OptimizedEvaluation.features and of its precomputed style-weight vector
+EVALUATION_TERMS = (
+    "material",
+    "center_control",
+    "mobility",
+    "king_safety",
+    "opening_principles",
+)
+
 # Precomputed center squares for fast lookup
 CENTER_SQUARES_0X88_OPTIMIZED = [51, 52, 67, 68]  # d4, d5, e4, e5
 
@@ -176,6 +188,61 @@ def _rank_of_cached(index: int) -> int:
     return index >> 4
 
 
+# Fetches the 64 on-board squares of a 0x88 list in one C-level call
+_ON_BOARD = itemgetter(*BOARD_SQUARES)
+
+# Per-piece mobility estimate, signed by colour (White positive); empty is 0
+_SIGNED_MOBILITY: Dict[str, int] = {"\u0000": 0}
+for _piece, _mobility in {"p": 2, "n": 4, "b": 6, "r": 8, "q": 12, "k": 3}.items():
+    _SIGNED_MOBILITY[_piece.upper()] = _mobility
+    _SIGNED_MOBILITY[_piece] = -_mobility
+
+# On-board pawn-shield squares around each king square, built once at import.
+# The offset lists repeat the three forward squares, so those count twice
+_WHITE_SHIELD_OFFSETS = (-17, -16, -15, -1, 1, -17, -16, -15)
+_BLACK_SHIELD_OFFSETS = (15, 16, 17, -1, 1, 15, 16, 17)
+_WHITE_SHIELD_SQUARES: Dict[int, Tuple[int, ...]] = {
+    sq: tuple(sq + off for off in _WHITE_SHIELD_OFFSETS if not (sq + off) & 0x88)
+    for sq in BOARD_SQUARES
+}
+_BLACK_SHIELD_SQUARES: Dict[int, Tuple[int, ...]] = {
+    sq: tuple(sq + off for off in _BLACK_SHIELD_OFFSETS if not (sq + off) & 0x88)
+    for sq in BOARD_SQUARES
+}
+
+
+@lru_cache(maxsize=64)
+def _weight_vector_for(style_weights: Dict[str, float]) -> Tuple[float, ...]:
+    """Weight per EVALUATION_TERMS entry for a hashable (read-only) weights mapping."""
+    return tuple(style_weights.get(term, 1.0) for term in EVALUATION_TERMS)
+
+
+@lru_cache(maxsize=64)
+def _weighted_total_for(
+    weight_vector: Tuple[float, ...],
+) -> Callable[[Tuple[float, ...]], float]:
+    """Return a scorer for feature vectors with ``weight_vector`` bound in its closure.
+
+    Specialized once per distinct weight vector: the dot product is unrolled
+    over the EVALUATION_TERMS entries, with no loop or per-term lookups.
+    """
+    w_material, w_center, w_mobility, w_king_safety, w_opening = weight_vector
+
+    def weighted_total(features: Tuple[float, ...]) -> float:
+        material, center, mobility, king_safety, opening = features
+        # Same left-to-right accumulation from 0.0 as the traced evaluation
+        return (
+            0.0
+            + material * w_material
+            + center * w_center
+            + mobility * w_mobility
+            + king_safety * w_king_safety
+            + opening * w_opening
+        )
+
+    return weighted_total
+
+
 class OptimizedEvaluationResult:
     """Optimized evaluation result with minimal overhead."""
 
@@ -196,7 +263,7 @@ class OptimizedEvaluation:
         logger: Optional[Callable[[str], None]] = None,
     ) -> None:
         """Initialize optimized evaluator."""
-        self.style_weights = style_weights or {}
+        self.style_weights = style_weights
         self.enable_caching = enable_caching
         self.enable_fast_paths = enable_fast_paths
         self._logger = logger
@@ -208,12 +275,32 @@ class OptimizedEvaluation:
         self._evaluation_count = 0
         self._total_time = 0.0
 
-        # Evaluation cache
-        self._evaluation_cache: Dict[str, OptimizedEvaluationResult] = {}
+        # Evaluation cache of raw feature vectors; style weights are applied
+        # on read, so a style change never serves stale totals
+        self._evaluation_cache: Dict[str, Tuple[float, ...]] = {}
         self._cache_hits = 0
         self._cache_misses = 0
         self._log_buffer: List[str] = []
 
+    @property
+    def style_weights(self) -> Dict[str, float]:
+        """Style weights applied to the evaluation terms."""
+        return self._style_weights
+
+    @style_weights.setter
+    def style_weights(self, style_weights: Optional[Dict[str, float]]) -> None:
+        self._style_weights = style_weights or {}
+        # Weight per EVALUATION_TERMS entry, so a total is one dot product.
+        # Cached style profiles are hashable and share one vector per profile;
+        # plain dicts are converted per evaluator
+        try:
+            self._weight_vector = _weight_vector_for(self._style_weights)
+        except TypeError:
+            self._weight_vector = tuple(
+                self._style_weights.get(term, 1.0) for term in EVALUATION_TERMS
+            )
+        self._weighted_total = _weighted_total_for(self._weight_vector)
+
     def _log(self, msg: str) -> None:
         """Log a message to buffer and logger if available."""
         if self._logger is not None:
@@ -227,32 +314,34 @@ class OptimizedEvaluation:
 
     @profile_method("optimized_evaluate")
     def evaluate(self, position: Any) -> float:
-        """Evaluate position with performance optimizations."""
+        """Evaluate position with performance optimizations.
+
+        Computes the raw feature vector (cached per position) and takes its
+        dot product with the precomputed style-weight vector. The per-term
+        trace is only built by ``explain_evaluation``.
+        """
         start_time = time.perf_counter()
 
         # Check cache first
+        features = None
         if self.enable_caching:
             position_key = self._get_position_key(position)
-            if position_key in self._evaluation_cache:
-                self._cache_hits += 1
-                result = self._evaluation_cache[position_key]
-                self._evaluation_count += 1
-                self._total_time += time.perf_counter() - start_time
-                return result.total
-
-        self._cache_misses += 1
+            features = self._evaluation_cache.get(position_key)
 
-        # Perform evaluation
-        result = self._evaluate_internal_optimized(position)
+        if features is not None:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+            features = self.features(position)
+            if self.enable_caching:
+                self._evaluation_cache[position_key] = features
 
-        # Cache result
-        if self.enable_caching:
-            self._evaluation_cache[position_key] = result
+        total = self._weighted_total(features)
 
         self._evaluation_count += 1
         self._total_time += time.perf_counter() - start_time
 
-        return result.total
+        return total
 
     def explain_evaluation(self, position: Any) -> Dict[str, Any]:
         """Return breakdown of evaluation components and applied weights."""
@@ -269,12 +358,12 @@ class OptimizedEvaluation:
         # Simple hash of position state
         return f"{position.side_to_move}_{hash(tuple(position.squares))}"
 
-    @profile_method("optimized_evaluate_internal")
-    def _evaluate_internal_optimized(self, position: Any) -> OptimizedEvaluationResult:
-        """Optimized internal evaluation."""
+    @profile_method("optimized_features")
+    def features(self, position: Any) -> Tuple[float, ...]:
+        """Return the unweighted term scores of ``position``, ordered as EVALUATION_TERMS."""
         # Fast path for common positions
         if self.enable_fast_paths and self._is_starting_position(position):
-            return self._evaluate_starting_position()
+            return (0.0,) * len(EVALUATION_TERMS)
 
         # Material evaluation (optimized)
         material_cp = self._score_material_optimized(position)
@@ -287,14 +376,23 @@ class OptimizedEvaluation:
         # Opening principles heuristics (lightweight, no book dependency)
         opening_cp = self._score_opening_principles(position)
 
+        return (
+            float(material_cp),
+            float(center_cp),
+            float(mobility_cp),
+            float(king_safety_cp),
+            float(opening_cp),
+        )
+
+    @profile_method("optimized_evaluate_internal")
+    def _evaluate_internal_optimized(self, position: Any) -> OptimizedEvaluationResult:
+        """Optimized internal evaluation."""
+        # Fast path for common positions
+        if self.enable_fast_paths and self._is_starting_position(position):
+            return self._evaluate_starting_position()
+
         # Combine terms
-        breakdown = {
-            "material": float(material_cp),
-            "center_control": float(center_cp),
-            "mobility": float(mobility_cp),
-            "king_safety": float(king_safety_cp),
-            "opening_principles": float(opening_cp),
-        }
+        breakdown = dict(zip(EVALUATION_TERMS, self.features(position)))
 
         # Apply style weights
         total = 0.0
@@ -367,10 +465,7 @@ class OptimizedEvaluation:
         score = 0
 
         # Fast iteration over board
-        for idx in range(128):
-            if _is_offboard_cached(idx):
-                continue
-
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece == "\u0000":
                 continue
@@ -403,45 +498,12 @@ class OptimizedEvaluation:
     @profile_method("optimized_mobility")
     def _score_mobility_optimized(self, position: Any) -> int:
         """Optimized mobility evaluation."""
-        score = 0
-
-        # Count available moves for each piece
-        for idx in range(128):
-            if _is_offboard_cached(idx):
-                continue
-
-            piece = position.squares[idx]
-            if piece == "\u0000":
-                continue
-
-            # Simple mobility count (this would be optimized further)
-            mobility = self._count_moves_for_piece(position, idx)
-            score += mobility if _is_white_cached(piece) else -mobility
-
-        return score
+        # Typical mobility per piece type, looked up from the signed table
+        return sum(map(_SIGNED_MOBILITY.__getitem__, _ON_BOARD(position.squares)))
 
     def _count_moves_for_piece(self, position: Any, idx: int) -> int:
         """Count moves for a specific piece (simplified for performance)."""
-        piece = position.squares[idx]
-        if piece == "\u0000":
-            return 0
-
-        # Simplified mobility calculation
-        lower = piece.lower()
-        if lower == "p":
-            return 2  # Typical pawn mobility
-        elif lower == "n":
-            return 4  # Typical knight mobility
-        elif lower == "b":
-            return 6  # Typical bishop mobility
-        elif lower == "r":
-            return 8  # Typical rook mobility
-        elif lower == "q":
-            return 12  # Typical queen mobility
-        elif lower == "k":
-            return 3  # Typical king mobility
-
-        return 0
+        return abs(_SIGNED_MOBILITY.get(position.squares[idx], 0))
 
     @profile_method("optimized_king_safety")
     def _score_king_safety_optimized(self, position: Any) -> int:
@@ -462,42 +524,22 @@ class OptimizedEvaluation:
 
     def _find_king(self, position: Any, white: bool) -> Optional[int]:
         """Find king position."""
-        for idx in range(128):
-            if _is_offboard_cached(idx):
-                continue
-
-            piece = position.squares[idx]
-            if piece == "\u0000":
-                continue
-
-            if piece.lower() == "k" and _is_white_cached(piece) == white:
-                return idx
-
-        return None
+        # Off-board slots are always empty, so a list scan finds the same
+        # (lowest) on-board square as walking BOARD_SQUARES
+        try:
+            return position.squares.index("K" if white else "k")
+        except ValueError:
+            return None
 
     def _evaluate_king_safety(self, position: Any, king_sq: int, white: bool) -> int:
         """Evaluate king safety for a specific king."""
-        safety = 0
-
-        # Check pawn shield
+        # Pawn shield from the precomputed per-square tables
+        squares = position.squares
         if white:
-            # White king pawn shield
-            for offset in [-17, -16, -15, -1, 1, -17, -16, -15]:
-                shield_sq = king_sq + offset
-                if not _is_offboard_cached(shield_sq):
-                    piece = position.squares[shield_sq]
-                    if piece == "P":
-                        safety += 5
+            shield = [squares[sq] for sq in _WHITE_SHIELD_SQUARES[king_sq]].count("P")
         else:
-            # Black king pawn shield
-            for offset in [15, 16, 17, -1, 1, 15, 16, 17]:
-                shield_sq = king_sq + offset
-                if not _is_offboard_cached(shield_sq):
-                    piece = position.squares[shield_sq]
-                    if piece == "p":
-                        safety += 5
-
-        return safety
+            shield = [squares[sq] for sq in _BLACK_SHIELD_SQUARES[king_sq]].count("p")
+        return 5 * shield
 
     def _score_opening_principles(self, position: Any) -> int:
         """Score opening phase heuristics (development, center, king safety triggers).
@@ -566,10 +608,7 @@ class OptimizedEvaluation:
                     score -= 5  # Penalty for undeveloped bishop
 
         # Reward knights and bishops away from back rank
-        for idx in range(128):
-            if _is_offboard_cached(idx):
-                continue
-
+        for idx in BOARD_SQUARES:
             piece = position.squares[idx]
             if piece == "\u0000":
                 continue
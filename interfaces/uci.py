@@ -9,7 +9,14 @@ import sys
 from typing import List, Optional
 
 from core.board import Board
-from core.moves import Move, generate_moves, make_move, parse_uci_move, unmake_move
+from core.moves import (
+    Move,
+    clear_move_cache,
+    generate_moves,
+    make_move,
+    parse_uci_move,
+    unmake_move,
+)
 from search.mcts import heuristic_move_ordering
 from search.mcts_optimized import OptimizedMCTSSearch
 
@@ -38,6 +45,9 @@ class UCIEngine:
             return "readyok"
         elif cmd == "ucinewgame":
             self.position.set_startpos()
+            clear_move_cache()
+            if self.search_engine is not None:
+                self.search_engine.clear_tree()
             return None
         elif cmd == "position":
             # Supported: 'position startpos [moves ...]' or 'position fen <fen> [moves ...]'
@@ -103,6 +113,7 @@ class UCIEngine:
                     and lm.to_square == mv.to_square
                     and lm.promotion == mv.promotion
                 ):
+                    self._advance_search_tree(mv)
                     make_move(self.position, mv)
                     return
             # If not legal, ignore in minimal implementation
@@ -110,11 +121,16 @@ class UCIEngine:
             # Ignore malformed moves for robustness in early phase
             return
 
+    def _advance_search_tree(self, move: Move) -> None:
+        """Follow ``move`` in the retained search tree if it is rooted here."""
+        engine = self.search_engine
+        if engine is not None and engine.root_key == self.position.zobrist:
+            engine.advance(move)
+
     def _handle_go_command(self, args: List[str]) -> str:
         """Handle UCI go command with time controls, movetime, and nodes parameters."""
         movetime_ms = None
         max_nodes = None
-        seed = None
         wtime = None
         btime = None
         winc = 0
@@ -174,11 +190,6 @@ class UCIEngine:
 
         # Create optimized search engine with parameters
         max_playouts = max_nodes if max_nodes else 10000
-        # Use current time as seed for randomness if no seed provided
-        if seed is None:
-            import time
-
-            seed = int(time.time() * 1000000) % (2**31)
 
         # Apply a small safety margin to movetime to stabilize PV near deadlines
         if movetime_ms is not None:
@@ -186,14 +197,23 @@ class UCIEngine:
         else:
             buffered_movetime = None
 
-        self.search_engine = OptimizedMCTSSearch(
-            max_playouts=max_playouts,
-            movetime_ms=buffered_movetime,
-            seed=seed,
-            move_ordering_hook=heuristic_move_ordering,
-            enable_caching=True,
-            enable_move_ordering=True,
-        )
+        # Keep one engine per game so its tree carries over between moves
+        if self.search_engine is None:
+            import time
+
+            # Seeded from the clock once per game; later moves continue its RNG
+            seed = int(time.time() * 1000000) % (2**31)
+            self.search_engine = OptimizedMCTSSearch(
+                max_playouts=max_playouts,
+                movetime_ms=buffered_movetime,
+                seed=seed,
+                move_ordering_hook=heuristic_move_ordering,
+                enable_caching=True,
+                enable_move_ordering=True,
+            )
+        else:
+            self.search_engine.max_playouts = max_playouts
+            self.search_engine.movetime_ms = buffered_movetime
 
         # Run search
         best_move = self.search_engine.search(self.position)
@@ -3,57 +3,71 @@
 Manual UCI Testing Script
 
 This script tests the UCI engine by running it in a subprocess and
-communicating through stdin/stdout properly.
+communicating through stdin/stdout with asyncio, so responses are awaited
+instead of polled.
 """
 
-import os
-import subprocess
+import asyncio
 import sys
 import time
 
 
-def test_uci_engine():
+async def test_uci_engine():
     """Test the UCI engine with proper subprocess handling."""
     print("Testing Zyra UCI Engine")
     print("=" * 40)
 
     # Start the engine
     print("Starting engine...")
-    process = subprocess.Popen(
-        [sys.executable, "-m", "interfaces.uci"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "interfaces.uci",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
 
-    def send_and_wait(command, expected=None, timeout=5):
+    # Engine output read but not yet consumed, carried across commands
+    buf = bytearray()
+
+    async def send_and_wait(command, expected=None, timeout=5):
         """Send command and wait for response."""
         print(f"\nSending: {command}")
 
         # Send command
-        process.stdin.write(command + "\n")
-        process.stdin.flush()
+        process.stdin.write((command + "\n").encode())
+        await process.stdin.drain()
 
-        # Read response
-        start_time = time.time()
+        # Read response in chunks and split lines locally, so several info
+        # lines arriving together cost one read instead of one per line
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
         response_lines = []
-
-        while time.time() - start_time < timeout:
-            try:
-                line = process.stdout.readline()
-                if line:
-                    response_lines.append(line.strip())
-                    print(f"Received: {line.strip()}")
-
-                    # Check if we got the expected response
-                    if expected and expected.lower() in line.lower():
-                        break
-                else:
-                    time.sleep(0.01)
-            except:
-                break
+        found = False
+
+        while expected and not found:
+            newline = buf.find(b"\n")
+            if newline < 0:
+                remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+                if remaining <= 0:
+                    break
+                try:
+                    chunk = await asyncio.wait_for(process.stdout.read(4096), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if not chunk:
+                    # Engine closed stdout
+                    break
+                buf.extend(chunk)
+                continue
+
+            text = buf[:newline].decode().strip()
+            del buf[: newline + 1]
+            response_lines.append(text)
+            print(f"Received: {text}")
+
+            # Check if we got the expected response
+            found = expected.lower() in text.lower()
 
         response = "\n".join(response_lines)
 
@@ -80,7 +94,7 @@ def test_uci_engine():
 
         passed = 0
         for command, expected in tests:
-            if send_and_wait(command, expected):
+            if await send_and_wait(command, expected):
                 passed += 1
 
         print(f"\nBasic commands: {passed}/{len(tests)} passed")
@@ -94,17 +108,17 @@ def test_uci_engine():
 
         search_passed = 0
         for command, expected in search_tests:
-            if send_and_wait(command, expected, timeout=10):
+            if await send_and_wait(command, expected, timeout=10):
                 search_passed += 1
 
         print(f"Search commands: {search_passed}/{len(search_tests)} passed")
 
         # Test quit
         print("\n=== Cleanup ===")
-        send_and_wait("quit", None)
+        await send_and_wait("quit", None)
 
         # Wait for process to exit
-        process.wait(timeout=2)
+        await asyncio.wait_for(process.wait(), timeout=2)
 
         total_passed = passed + search_passed
         total_tests = len(tests) + len(search_tests)
@@ -125,14 +139,14 @@ def test_uci_engine():
     finally:
         # Clean up
         try:
-            if process.poll() is None:
+            if process.returncode is None:
                 process.terminate()
-                process.wait(timeout=1)
+                await asyncio.wait_for(process.wait(), timeout=1)
         except:
             pass
 
 
-def test_stability():
+async def test_stability():
     """Test engine stability with multiple games."""
     print("\n" + "=" * 40)
     print("STABILITY TESTING")
@@ -143,27 +157,28 @@ def test_stability():
     print("Running basic stability test...")
 
     # Test that the engine can handle multiple commands
-    process = subprocess.Popen(
-        [sys.executable, "-m", "interfaces.uci"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "interfaces.uci",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
 
     try:
-        # Send a sequence of commands
+        # Send the whole sequence in one write; the engine reads stdin line by
+        # line and exits on its own "quit", so no pacing between commands is needed
         commands = ["uci", "isready", "ucinewgame", "position startpos", "go movetime 500", "quit"]
 
         for cmd in commands:
             print(f"Sending: {cmd}")
-            process.stdin.write(cmd + "\n")
-            process.stdin.flush()
-            time.sleep(0.1)
+        process.stdin.write(("\n".join(commands) + "\n").encode())
+        await process.stdin.drain()
+        process.stdin.close()
 
-        # Wait for process to finish
-        process.wait(timeout=5)
+        # Drain output while waiting for the process to finish
+        await asyncio.wait_for(process.communicate(), timeout=5)
         print("✅ Stability test completed without crashes")
         return True
 
@@ -172,22 +187,22 @@ def test_stability():
         return False
     finally:
         try:
-            if process.poll() is None:
+            if process.returncode is None:
                 process.terminate()
         except:
             pass
 
 
-def main():
+async def run_all():
     """Run all tests."""
     print("Zyra Chess Engine - UCI Conformance Testing")
     print("=" * 50)
 
     # Test basic UCI functionality
-    uci_success = test_uci_engine()
+    uci_success = await test_uci_engine()
 
     # Test stability
-    stability_success = test_stability()
+    stability_success = await test_stability()
 
     print("\n" + "=" * 50)
     print("FINAL RESULTS:")
@@ -202,5 +217,10 @@ def main():
         return 1
 
 
+def main():
+    """Entry point wrapping the async test run."""
+    return asyncio.run(run_all())
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,22 +2,26 @@
 
 This module provides comprehensive benchmarking capabilities to validate
 performance targets across search, evaluation, and core operations.
+
+Engine modules are imported inside the benchmark methods that use them, so
+importing this module (e.g. only to read ``BenchmarkResult``) stays cheap.
 """
 
+from __future__ import annotations
+
 import random
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from timeit import Timer
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from core.board import Board
-from core.moves import Move, generate_moves, is_legal_move
-from eval.heuristics import Evaluation, parse_style_config
-from search.mcts import MCTSSearch
+if TYPE_CHECKING:
+    from core.board import Board
 
 from .metrics import MetricsCollector, PerformanceMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result of a performance benchmark."""
 
@@ -51,7 +55,16 @@ class PerformanceBenchmark:
         max_playouts: int = 100,  # Reduced default for faster tests
         movetime_ms: Optional[int] = None,
     ) -> BenchmarkResult:
-        """Benchmark search performance against targets."""
+        """Benchmark search performance against targets.
+
+        For budgets of 100 playouts or more, a short untimed 10-playout search
+        runs first so one-time setup costs do not skew the measurement.
+        """
+        from search.mcts import MCTSSearch
+
+        if max_playouts >= 100:
+            MCTSSearch(max_playouts=10, seed=42).search(position)  # warmup
+
         self.collector.start_timer("search")
 
         # Create search engine
@@ -97,15 +110,22 @@ class PerformanceBenchmark:
     def benchmark_evaluation_performance(
         self, position: Board, num_evaluations: int = 1000
     ) -> BenchmarkResult:
-        """Benchmark evaluation performance against targets."""
+        """Benchmark evaluation performance against targets.
+
+        One untimed evaluation runs first to absorb first-call costs.
+        """
+        from eval.heuristics import Evaluation
+
         evaluator = Evaluation()
+        evaluate = evaluator.evaluate
+        evaluate(position)  # warmup
 
         self.collector.start_timer("evaluation")
         start_time = time.perf_counter()
 
-        # Run multiple evaluations
+        # Run multiple evaluations; the bound method is hoisted out of the loop
         for _ in range(num_evaluations):
-            score = evaluator.evaluate(position)
+            evaluate(position)
 
         end_time = time.perf_counter()
         evaluation_time_ms = (end_time - start_time) * 1000
@@ -142,7 +162,14 @@ class PerformanceBenchmark:
     def benchmark_move_generation_performance(
         self, position: Board, num_iterations: int = 1000
     ) -> BenchmarkResult:
-        """Benchmark move generation performance against targets."""
+        """Benchmark move generation performance against targets.
+
+        One untimed generation runs first to absorb first-call costs.
+        """
+        from core.moves import generate_moves
+
+        generate_moves(position)  # warmup
+
         self.collector.start_timer("move_generation")
         start_time = time.perf_counter()
 
@@ -179,26 +206,38 @@ class PerformanceBenchmark:
         return result
 
     def benchmark_move_validation_performance(
-        self, position: Board, num_iterations: int = 1000
+        self, position: Board, num_iterations: Optional[int] = None
     ) -> BenchmarkResult:
-        """Benchmark move validation performance against targets."""
+        """Benchmark move validation performance against targets.
+
+        One untimed validation pass over the moves runs first to absorb
+        first-call costs. When ``num_iterations`` is None, the number of
+        passes is chosen by ``timeit.Timer.autorange`` so the timed region
+        lasts at least 0.2 seconds.
+        """
+        from core.moves import Move, generate_moves, is_legal_move
+
         # Generate some moves to validate
         moves = generate_moves(position)
         if not moves:
             # Create dummy moves for testing
             moves = [Move(0, 1), Move(1, 2), Move(2, 3)]
 
-        self.collector.start_timer("move_validation")
-        start_time = time.perf_counter()
+        for move in moves:  # warmup
+            is_legal_move(position, move)
 
-        total_validations = 0
-        for _ in range(num_iterations):
-            for move in moves:
-                is_legal_move(position, move)
-                total_validations += 1
+        self.collector.start_timer("move_validation")
+        timer = Timer(
+            "for move in moves: is_legal_move(position, move)",
+            globals={"moves": moves, "is_legal_move": is_legal_move, "position": position},
+        )
+        if num_iterations is None:
+            num_iterations, validation_time_s = timer.autorange()
+        else:
+            validation_time_s = timer.timeit(num_iterations)
 
-        end_time = time.perf_counter()
-        validation_time_ms = (end_time - start_time) * 1000
+        total_validations = num_iterations * len(moves)
+        validation_time_ms = validation_time_s * 1000
         per_validation_time_ms = (
             validation_time_ms / total_validations if total_validations > 0 else 0
         )
@@ -230,29 +269,42 @@ class PerformanceBenchmark:
         self, position: Board, styles: List[str] = ["aggressive", "defensive", "experimental"]
     ) -> BenchmarkResult:
         """Benchmark style performance consistency."""
+        from eval.heuristics import Evaluation, parse_style_config
+
+        if len(styles) <= 1:
+            # Variance across a single style is trivially zero; skip the timing loop
+            self.collector.record_style_variance(0.0)
+            metrics = self.collector.finalize_metrics()
+            result = BenchmarkResult(
+                test_name="style_consistency",
+                metrics=metrics,
+                passed=True,
+                target_met=metrics.meets_targets(),
+                notes=["Single style; variance trivially 0."],
+            )
+            self.results.append(result)
+            return result
+
         style_metrics = []
 
         for style in styles:
             # Parse style configuration
             style_config = parse_style_config(style)
-            evaluator = Evaluation(style_weights=style_config)
+            evaluate = Evaluation(style_weights=style_config).evaluate
 
             # Time evaluation
             start_time = time.perf_counter()
             for _ in range(100):  # Multiple evaluations for consistency
-                score = evaluator.evaluate(position)
+                evaluate(position)
             end_time = time.perf_counter()
 
             evaluation_time_ms = (end_time - start_time) * 1000
             style_metrics.append(evaluation_time_ms)
 
         # Calculate variance
-        if len(style_metrics) > 1:
-            avg_time = sum(style_metrics) / len(style_metrics)
-            variance = sum((t - avg_time) ** 2 for t in style_metrics) / len(style_metrics)
-            variance_percent = (variance**0.5 / avg_time * 100) if avg_time > 0 else 0
-        else:
-            variance_percent = 0
+        avg_time = sum(style_metrics) / len(style_metrics)
+        variance = sum((t - avg_time) ** 2 for t in style_metrics) / len(style_metrics)
+        variance_percent = (variance**0.5 / avg_time * 100) if avg_time > 0 else 0
 
         # Record metrics
         self.collector.record_style_variance(variance_percent)
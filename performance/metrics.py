@@ -8,10 +8,10 @@ import json
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Container for performance metrics."""
 
@@ -40,15 +40,10 @@ class PerformanceMetrics:
     # Style performance consistency
     style_variance_percent: float = 0.0
 
-    # Legacy field for backward compatibility with serialized data
+    # Legacy field for backward compatibility with serialized data; ignored,
+    # targets are computed dynamically via meets_targets()
     targets_met: Optional[Dict[str, bool]] = None
 
-    def __post_init__(self):
-        """Handle legacy targets_met field."""
-        # If targets_met was provided during deserialization, ignore it
-        # We compute it dynamically via meets_targets()
-        pass
-
     def meets_targets(self) -> Dict[str, bool]:
         """Check if metrics meet performance targets."""
         return {
@@ -80,13 +75,54 @@ class PerformanceMetrics:
         }
 
 
+# Fields aggregated by MetricsCollector; integer counters average with floor division
+_AVERAGED_FIELDS = (
+    "nodes_per_second",
+    "total_nodes",
+    "search_time_ms",
+    "evaluation_time_ms",
+    "evaluations_per_second",
+    "total_evaluations",
+    "move_generation_time_ms",
+    "moves_generated",
+    "move_validation_time_ms",
+    "moves_validated",
+    "memory_usage_mb",
+    "peak_memory_mb",
+    "style_variance_percent",
+)
+_INTEGER_FIELDS = frozenset(
+    {"total_nodes", "total_evaluations", "moves_generated", "moves_validated"}
+)
+
+
+def _accumulate(totals: Dict[str, float], metrics: PerformanceMetrics) -> None:
+    """Add one measurement into per-field running totals."""
+    for name in _AVERAGED_FIELDS:
+        totals[name] += getattr(metrics, name)
+
+
+def _average(totals: Dict[str, float], count: int) -> PerformanceMetrics:
+    """Build averaged metrics from per-field totals over ``count`` measurements."""
+    if not count:
+        return PerformanceMetrics()
+
+    averages = {
+        name: total // count if name in _INTEGER_FIELDS else total / count
+        for name, total in totals.items()
+    }
+    return PerformanceMetrics(**averages)
+
+
 class MetricsCollector:
     """Collects and aggregates performance metrics."""
 
     def __init__(self):
-        self.metrics: List[PerformanceMetrics] = []
         self.current_metrics = PerformanceMetrics()
         self._start_times: Dict[str, float] = {}
+        self._totals: Dict[str, float] = dict.fromkeys(_AVERAGED_FIELDS, 0)
+        self._count = 0
+        self._worst: Optional[PerformanceMetrics] = None
 
     def start_timer(self, operation: str) -> None:
         """Start timing an operation."""
@@ -130,59 +166,78 @@ class MetricsCollector:
         self.current_metrics.style_variance_percent = variance_percent
 
     def finalize_metrics(self) -> PerformanceMetrics:
-        """Finalize and store current metrics."""
-        self.metrics.append(self.current_metrics)
+        """Finalize current metrics and fold them into the running aggregates.
+
+        The finalized record itself is not retained here; callers keep it
+        (e.g. via ``BenchmarkResult.metrics``) for as long as they need it.
+        """
         finalized = self.current_metrics
+        _accumulate(self._totals, finalized)
+        self._count += 1
+        if self._worst is None or finalized.nodes_per_second < self._worst.nodes_per_second:
+            self._worst = finalized
+
         self.current_metrics = PerformanceMetrics()
         return finalized
 
-    def get_average_metrics(self) -> PerformanceMetrics:
-        """Calculate average metrics across all recorded measurements."""
-        if not self.metrics:
-            return PerformanceMetrics()
-
-        total = len(self.metrics)
-        return PerformanceMetrics(
-            nodes_per_second=sum(m.nodes_per_second for m in self.metrics) / total,
-            total_nodes=sum(m.total_nodes for m in self.metrics) // total,
-            search_time_ms=sum(m.search_time_ms for m in self.metrics) / total,
-            evaluation_time_ms=sum(m.evaluation_time_ms for m in self.metrics) / total,
-            evaluations_per_second=sum(m.evaluations_per_second for m in self.metrics) / total,
-            total_evaluations=sum(m.total_evaluations for m in self.metrics) // total,
-            move_generation_time_ms=sum(m.move_generation_time_ms for m in self.metrics) / total,
-            moves_generated=sum(m.moves_generated for m in self.metrics) // total,
-            move_validation_time_ms=sum(m.move_validation_time_ms for m in self.metrics) / total,
-            moves_validated=sum(m.moves_validated for m in self.metrics) // total,
-            memory_usage_mb=sum(m.memory_usage_mb for m in self.metrics) / total,
-            peak_memory_mb=sum(m.peak_memory_mb for m in self.metrics) / total,
-            style_variance_percent=sum(m.style_variance_percent for m in self.metrics) / total,
+    def get_average_metrics(
+        self, metrics: Optional[Sequence[PerformanceMetrics]] = None
+    ) -> PerformanceMetrics:
+        """Calculate average metrics.
+
+        Averages the given ``metrics`` when provided, otherwise every
+        measurement finalized by this collector.
+        """
+        if metrics is None:
+            return _average(self._totals, self._count)
+
+        totals: Dict[str, float] = dict.fromkeys(_AVERAGED_FIELDS, 0)
+        for m in metrics:
+            _accumulate(totals, m)
+        return _average(totals, len(metrics))
+
+    def get_worst_metrics(
+        self, metrics: Optional[Sequence[PerformanceMetrics]] = None
+    ) -> PerformanceMetrics:
+        """Get the worst performing metrics (for regression detection).
+
+        Considers the given ``metrics`` when provided, otherwise every
+        measurement finalized by this collector.
+        """
+        worst = (
+            self._worst
+            if metrics is None
+            else min(metrics, key=lambda m: m.nodes_per_second, default=None)
         )
+        return worst if worst is not None else PerformanceMetrics()
 
-    def get_worst_metrics(self) -> PerformanceMetrics:
-        """Get the worst performing metrics (for regression detection)."""
-        if not self.metrics:
-            return PerformanceMetrics()
 
-        return min(self.metrics, key=lambda m: m.nodes_per_second)
+# Metric field that receives the duration of each timed operation
+_OPERATION_FIELDS = {
+    "search": "search_time_ms",
+    "evaluation": "evaluation_time_ms",
+    "move_gen": "move_generation_time_ms",
+    "move_generation": "move_generation_time_ms",
+    "move_val": "move_validation_time_ms",
+    "move_validation": "move_validation_time_ms",
+}
 
 
 @contextmanager
 def time_operation(collector: MetricsCollector, operation: str):
-    """Context manager for timing operations."""
+    """Context manager for timing operations.
+
+    ``operation`` must be one of the keys of ``_OPERATION_FIELDS`` for the
+    duration to be stored; other names are timed but not recorded.
+    """
     collector.start_timer(operation)
     try:
         yield
     finally:
         duration_ms = collector.end_timer(operation)
-        # Store duration in appropriate metric based on operation name
-        if "search" in operation:
-            collector.current_metrics.search_time_ms = duration_ms
-        elif "evaluation" in operation:
-            collector.current_metrics.evaluation_time_ms = duration_ms
-        elif "move_gen" in operation:
-            collector.current_metrics.move_generation_time_ms = duration_ms
-        elif "move_val" in operation:
-            collector.current_metrics.move_validation_time_ms = duration_ms
+        field_name = _OPERATION_FIELDS.get(operation)
+        if field_name is not None:
+            setattr(collector.current_metrics, field_name, duration_ms)
 
 
 @dataclass
@@ -4,10 +4,15 @@ This module provides profiling capabilities to identify performance
 bottlenecks in search, evaluation, and core operations.
 """
 
-import functools
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Raw samples kept per function for ad-hoc analysis; summaries come from
+# running aggregates, so calls beyond the cap are still counted
+MAX_TIMING_SAMPLES = 4096
 
 
 @dataclass
@@ -29,46 +34,84 @@ class ProfilerContext:
 
 
 class PerformanceProfiler:
-    """Profiler for detailed performance analysis."""
+    """Profiler for detailed performance analysis.
+
+    Decorated functions are registered by code object and left unwrapped.
+    Timing comes from a ``sys.setprofile`` hook that is installed only while
+    profiling is enabled, so disabled profiling costs nothing per call. The
+    hook covers the enabling thread only: calls in other threads or worker
+    processes (e.g. ``MCTSSearch.search_parallel``) are never timed. Any
+    profile function already installed is suspended while enabled and
+    restored by ``disable``.
+    """
 
     def __init__(self):
         self.context = ProfilerContext()
         self.timings: Dict[str, List[float]] = {}
         self.call_counts: Dict[str, int] = {}
+        # Running [total, min, max] per function, updated on every call
+        self._aggregates: Dict[str, List[float]] = {}
+        # Report name for every registered function's code object
+        self._code_names: Dict[CodeType, str] = {}
+        # (frame, start time) for registered calls still on the stack
+        self._active_calls: List[Tuple[Any, float]] = []
         self.memory_snapshots: List[Dict[str, float]] = []
+        # Our installed hook, and the profile function it displaced
+        self._hook: Optional[Callable] = None
+        self._previous_profile: Optional[Callable] = None
 
     def enable(self, detailed: bool = False, memory: bool = False) -> None:
         """Enable profiling with optional detailed timing and memory tracking."""
         self.context.enabled = True
         self.context.detailed_timing = detailed
         self.context.memory_profiling = memory
+        self._active_calls.clear()
+        if self._hook is None:
+            self._previous_profile = sys.getprofile()
+        self._hook = self._make_hook()
+        sys.setprofile(self._hook)
 
     def disable(self) -> None:
         """Disable profiling."""
         self.context.enabled = False
         self.context.detailed_timing = False
         self.context.memory_profiling = False
+        # Leave a profile function installed after ours in place
+        if self._hook is not None and sys.getprofile() is self._hook:
+            sys.setprofile(self._previous_profile)
+        self._hook = None
+        self._previous_profile = None
+        self._active_calls.clear()
+
+    def _make_hook(self) -> Callable:
+        """Build the profile hook timing calls to registered functions."""
+        code_names = self._code_names
+        active_calls = self._active_calls
+        record_timing = self._record_timing
+        clock = time.perf_counter
+
+        def hook(frame, event, arg):
+            if event == "call":
+                if frame.f_code in code_names:
+                    active_calls.append((frame, clock()))
+            elif event == "return":
+                # Calls already running when profiling was enabled have no entry
+                if active_calls and active_calls[-1][0] is frame:
+                    start_time = active_calls.pop()[1]
+                    record_timing(code_names[frame.f_code], clock() - start_time)
+
+        return hook
+
+    def _register(self, func: Callable, func_name: str) -> Callable:
+        """Register ``func`` for timing under ``func_name`` and return it unchanged."""
+        self._code_names[func.__code__] = func_name
+        return func
 
     def profile_function(self, name: Optional[str] = None):
         """Decorator to profile function execution time."""
 
         def decorator(func: Callable) -> Callable:
-            func_name = name or f"{func.__module__}.{func.__name__}"
-
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                if not self.context.enabled:
-                    return func(*args, **kwargs)
-
-                start_time = time.perf_counter()
-                try:
-                    result = func(*args, **kwargs)
-                    return result
-                finally:
-                    duration = time.perf_counter() - start_time
-                    self._record_timing(func_name, duration)
-
-            return wrapper
+            return self._register(func, name or f"{func.__module__}.{func.__name__}")
 
         return decorator
 
@@ -76,46 +119,36 @@ class PerformanceProfiler:
         """Decorator to profile method execution time."""
 
         def decorator(func: Callable) -> Callable:
-            func_name = name or f"{func.__qualname__}"
-
-            @functools.wraps(func)
-            def wrapper(self, *args, **kwargs):
-                if not self.context.enabled:
-                    return func(self, *args, **kwargs)
-
-                start_time = time.perf_counter()
-                try:
-                    result = func(self, *args, **kwargs)
-                    return result
-                finally:
-                    duration = time.perf_counter() - start_time
-                    self._record_timing(func_name, duration)
-
-            return wrapper
+            return self._register(func, name or f"{func.__qualname__}")
 
         return decorator
 
     def _record_timing(self, name: str, duration: float) -> None:
         """Record timing for a function call."""
-        if name not in self.timings:
-            self.timings[name] = []
-            self.call_counts[name] = 0
-
-        self.timings[name].append(duration)
+        aggregate = self._aggregates.get(name)
+        if aggregate is None:
+            self._aggregates[name] = [duration, duration, duration]
+            self.timings[name] = [duration]
+            self.call_counts[name] = 1
+            return
+
+        aggregate[0] += duration
+        if duration < aggregate[1]:
+            aggregate[1] = duration
+        elif duration > aggregate[2]:
+            aggregate[2] = duration
         self.call_counts[name] += 1
 
+        samples = self.timings[name]
+        if len(samples) < MAX_TIMING_SAMPLES:
+            samples.append(duration)
+
     def get_timing_summary(self) -> Dict[str, Dict[str, float]]:
         """Get summary of timing data."""
         summary = {}
 
-        for name, timings in self.timings.items():
-            if not timings:
-                continue
-
-            total_time = sum(timings)
-            avg_time = total_time / len(timings)
-            min_time = min(timings)
-            max_time = max(timings)
+        for name, (total_time, min_time, max_time) in self._aggregates.items():
+            avg_time = total_time / self.call_counts[name]
 
             summary[name] = {
                 "total_time_ms": total_time * 1000,
@@ -142,6 +175,7 @@ class PerformanceProfiler:
         """Clear all profiling data."""
         self.timings.clear()
         self.call_counts.clear()
+        self._aggregates.clear()
         self.memory_snapshots.clear()
 
     def export_data(self) -> Dict[str, Any]:
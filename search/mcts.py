@@ -4,21 +4,49 @@ This module implements MCTS with configurable playout policies and
 stochastic exploration for chess engine decision making.
 """
 
+import functools
+import math
 import random
 import time
-from typing import Any, Callable, List, Optional
+from array import array
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from core.board import Board
 from core.moves import Move, generate_moves, make_move, unmake_move
-from core.zobrist import zobrist_hash
 from eval.heuristics import Evaluation, parse_style_config
 
 from .tt import TranspositionTable
 
+# Maximum number of positions kept in the evaluation cache (oldest evicted)
+EVAL_CACHE_SIZE = 1 << 20
+
+# Logistic scale for centipawns: 1 / (1 + 10**(-cp / 300)) == 1 / (1 + exp(-cp * K))
+_SIGMOID_K = math.log(10.0) / 300.0
+
 
 class MCTSNode:
     """Represents a node in the Monte Carlo search tree."""
 
+    # Thousands of nodes are built per search; slots drop the per-node dict
+    __slots__ = (
+        "position",
+        "move",
+        "parent",
+        "zkey",
+        "visits",
+        "value",
+        "children",
+        "child_visits",
+        "child_value",
+        "parent_slot",
+        "untried_moves",
+        "_legal_moves_generated",
+        "_moves_ordered",
+    )
+
     def __init__(
         self, position: Board, move: Optional[Move] = None, parent: Optional["MCTSNode"] = None
     ) -> None:
@@ -26,11 +54,21 @@ class MCTSNode:
         self.position = position
         self.move = move
         self.parent = parent
+        # Board keeps its Zobrist hash incrementally; selection and backprop
+        # reuse it for TT lookups
+        self.zkey = position.zobrist
         self.visits = 0
         self.value = 0.0
         self.children: List[MCTSNode] = []
+        # Child stats mirrored by slot (structure-of-arrays) in typed arrays,
+        # so selection scans contiguous unboxed storage instead of reading
+        # attributes off every child
+        self.child_visits = array("q")
+        self.child_value = array("d")
+        self.parent_slot = -1
         self.untried_moves: List[Move] = []
         self._legal_moves_generated = False
+        self._moves_ordered = False
 
     def is_fully_expanded(self) -> bool:
         """Check if all legal moves have been tried."""
@@ -46,8 +84,12 @@ class MCTSNode:
             self._legal_moves_generated = True
         return len(self.untried_moves) == 0
 
-    def get_ucb_score(self, exploration_constant: float = 1.414) -> float:
-        """Calculate UCB1 score for selection."""
+    def get_ucb_score(self, log_parent_visits: float, exploration_constant: float = 1.414) -> float:
+        """Calculate UCB1 score, ``Q/n + C * sqrt(ln(N) / n)``, for selection.
+
+        ``log_parent_visits`` is ``ln(N)`` for the parent, computed once by the
+        caller since it is shared by all siblings.
+        """
         if self.visits == 0:
             return float("inf")
 
@@ -55,10 +97,33 @@ class MCTSNode:
             return 0.0
 
         exploitation = self.value / self.visits
-        exploration = exploration_constant * (2 * (self.parent.visits**0.5) / self.visits) ** 0.5
+        exploration = exploration_constant * math.sqrt(log_parent_visits / self.visits)
         return exploitation + exploration
 
 
+def _select_ucb_child(node: MCTSNode, exploration_constant: float) -> MCTSNode:
+    """Return the child of ``node`` with the highest UCB1 score.
+
+    Scores all siblings in one loop over the node's per-slot stat lists,
+    equivalent to ``max(node.children, key=lambda c: c.get_ucb_score(...))``
+    without a method call and attribute lookups per child. Unvisited children
+    score infinity, so the first one found is returned immediately.
+    """
+    # ln(N) is shared by every sibling, so computed once per selection step
+    log_parent_visits = math.log(node.visits)
+    sqrt = math.sqrt
+    best_slot = 0
+    best_score = float("-inf")
+    for slot, (value, visits) in enumerate(zip(node.child_value, node.child_visits)):
+        if visits == 0:
+            return node.children[slot]
+        score = value / visits + exploration_constant * sqrt(log_parent_visits / visits)
+        if score > best_score:
+            best_score = score
+            best_slot = slot
+    return node.children[best_slot]
+
+
 class MCTSSearch:
     """Monte Carlo Tree Search engine."""
 
@@ -81,24 +146,111 @@ class MCTSSearch:
         # Evaluation configuration
         self.style_weights = parse_style_config(style)
         self.evaluator = Evaluation(style_weights=self.style_weights)
+        # Decided once: playouts pick uniformly when no style is configured
+        self._uniform = not self.style_weights
 
         # Transposition table and rollout cutoffs
         self.tt = tt or TranspositionTable(max_entries=200_000)
+        # Centipawn scores by Zobrist key and move clocks, separate from the
+        # visit-stat TT; the evaluator's start-position fast path reads the clocks
+        self._eval_cache: Dict[Tuple[int, int, int], float] = {}
         self.rollout_win_cp = rollout_win_cp
         self.rollout_loss_cp = rollout_loss_cp
 
-        # Per-instance RNG for reproducibility and isolation
+        # Per-instance RNG for reproducibility and isolation; playout sampling
+        # draws through the bound random() to skip per-sample attribute lookups
         self._rng = random.Random(seed)
-
-    def search(self, position: Board) -> Optional[Move]:
-        """Perform MCTS search and return best move."""
+        self._random = self._rng.random
+
+        # Constructor arguments handed to root-parallel workers
+        self._worker_config: Dict[str, Any] = {
+            "movetime_ms": movetime_ms,
+            "move_ordering_hook": move_ordering_hook,
+            "style": self.style_weights,
+            "rollout_win_cp": rollout_win_cp,
+            "rollout_loss_cp": rollout_loss_cp,
+        }
+
+        # Tree kept between searches; reused when the next search starts from its root
+        self._root: Optional[MCTSNode] = None
+
+    @property
+    def root_key(self) -> Optional[int]:
+        """Zobrist key of the retained tree's root, or None without a tree."""
+        return self._root.zkey if self._root is not None else None
+
+    def advance(self, move: Move) -> None:
+        """Re-root the retained tree at the child reached by ``move``.
+
+        Siblings are dropped so their subtrees can be reclaimed. If ``move``
+        was never expanded the tree is discarded.
+        """
+        root = self._root
+        self._root = None
+        if root is None:
+            return
+        for child in root.children:
+            if child.move == move:
+                child.parent = None
+                child.parent_slot = -1
+                self._root = child
+                return
+
+    def clear_tree(self) -> None:
+        """Discard the retained tree (e.g. on a new game)."""
+        self._root = None
+
+    @staticmethod
+    def _apply_root_ordering(root: MCTSNode, ordering: List[Move]) -> None:
+        """Make ``ordering`` the expansion order of ``root``'s untried moves.
+
+        Raises ``ValueError`` unless ``ordering`` lists each legal move of the
+        root exactly once. A retained root whose moves were already ordered
+        (by an earlier ordering or the hook) keeps that order; otherwise its
+        not yet expanded moves follow ``ordering``.
+        """
+        if len(set(ordering)) != len(ordering) or set(ordering) != set(
+            generate_moves(root.position)
+        ):
+            raise ValueError("initial_ordering must list the root's legal moves once each")
+        if root._moves_ordered:
+            return
+        if root._legal_moves_generated:
+            untried = set(root.untried_moves)
+            ordering = [move for move in ordering if move in untried]
+        # Reversed so pop() expands the best-ordered move first
+        root.untried_moves = ordering[::-1]
+        root._legal_moves_generated = True
+        root._moves_ordered = True
+
+    def search(
+        self, position: Board, initial_ordering: Optional[List[Move]] = None
+    ) -> Optional[Move]:
+        """Perform MCTS search and return best move.
+
+        Continues from the retained tree when its root is ``position``, so a
+        repeated call on the same position adds ``max_playouts`` visits to the
+        previous ones and does not reproduce the first call's seeded result;
+        call ``clear_tree()`` first for an independent search.
+        ``initial_ordering``, the legal moves of ``position`` already ordered
+        best-first, sets the root expansion order in place of the move
+        ordering hook; see ``_apply_root_ordering`` for a retained root.
+        Since the root no longer expands in generation order, a seeded search
+        given an ordering can pick a different move than one without it.
+        """
+        # Monotonic clock: deadlines must not move with wall-clock adjustments
         if self.movetime_ms is not None:
-            start_time = time.time()
+            start_time = time.monotonic()
             end_time = start_time + (self.movetime_ms / 1000.0)
         else:
             end_time = None
 
-        root = MCTSNode(position)
+        root = self._root
+        if root is None or root.zkey != position.zobrist:
+            # The tree outlives this call, so it must not share the caller's board
+            root = self._root = MCTSNode(position.clone())
+        if initial_ordering is not None:
+            self._apply_root_ordering(root, initial_ordering)
 
         # If no legal moves, return None
         if root.is_terminal():
@@ -108,7 +260,7 @@ class MCTSSearch:
 
         while playouts < self.max_playouts:
             # Check time limit if specified
-            if end_time is not None and time.time() >= end_time:
+            if end_time is not None and time.monotonic() >= end_time:
                 break
 
             # Selection and expansion phase
@@ -131,20 +283,70 @@ class MCTSSearch:
         best_child = max(root.children, key=lambda c: c.visits)
         return best_child.move
 
+    def search_parallel(self, position: Board, n_workers: int = 2) -> Optional[Move]:
+        """Root-parallel search: independent trees in worker processes.
+
+        Each worker searches ``position`` with its own seed and a share of
+        ``max_playouts``; root-child visits and values are summed per move and
+        the most visited move is returned. The calling process searches the
+        first share itself while the other ``n_workers - 1`` run in worker
+        processes. The move ordering hook must be picklable (a module-level
+        function).
+        """
+        if n_workers <= 1:
+            return self.search(position)
+
+        fen = position.to_fen()
+        base, extra = divmod(self.max_playouts, n_workers)
+        shares = [base + (1 if i < extra else 0) for i in range(n_workers)]
+        seeds = [self._rng.randrange(2**31) for _ in range(n_workers)]
+
+        totals: Dict[Tuple[int, int, Optional[str]], List[float]] = {}
+
+        def merge(root_stats: List[Tuple[Tuple[int, int, Optional[str]], int, float]]) -> None:
+            for key, visits, value in root_stats:
+                stats = totals.setdefault(key, [0, 0.0])
+                stats[0] += visits
+                stats[1] += value
+
+        with ProcessPoolExecutor(max_workers=n_workers - 1) as pool:
+            futures = [
+                pool.submit(_root_worker, fen, self._worker_config, seed, share)
+                for seed, share in zip(seeds[1:], shares[1:])
+                if share > 0
+            ]
+            # The caller would otherwise sit idle; it searches the first share
+            # while the workers run. Merge order does not change the sums
+            if shares[0] > 0:
+                merge(_root_worker(fen, self._worker_config, seeds[0], shares[0]))
+            for future in futures:
+                merge(future.result())
+
+        if not totals:
+            return None
+
+        from_square, to_square, promotion = max(totals, key=lambda key: totals[key][0])
+        return Move(from_square, to_square, promotion)
+
     def _selection(self, node: MCTSNode) -> MCTSNode:
         """Selection phase: traverse tree using UCB1."""
+        tt_get = self.tt.get
+        exploration_constant = self.exploration_constant
         while not node.is_terminal():
             if not node.is_fully_expanded():
                 return node
             else:
-                # Before selecting, try to prime child stats from TT
-                for child in node.children:
-                    key = zobrist_hash(child.position)
-                    entry = self.tt.get(key)
-                    if entry is not None and child.visits == 0:
-                        child.visits = entry.visits
-                        child.value = entry.value
-                node = max(node.children, key=lambda c: c.get_ucb_score(self.exploration_constant))
+                # Before selecting, try to prime unvisited child stats from TT;
+                # visited children keep their own stats, so skip their probes
+                child_visits = node.child_visits
+                if 0 in child_visits:
+                    for slot, child in enumerate(node.children):
+                        if child_visits[slot] == 0:
+                            entry = tt_get(child.zkey)
+                            if entry is not None:
+                                child.visits = child_visits[slot] = entry.visits
+                                child.value = node.child_value[slot] = entry.value
+                node = _select_ucb_child(node, exploration_constant)
         return node
 
     def _expansion(self, node: MCTSNode) -> MCTSNode:
@@ -152,26 +354,34 @@ class MCTSSearch:
         if not node.untried_moves:
             return node
 
+        # Order untried moves with the hook once, at the node's first expansion;
+        # reversed so pop() expands the best-ordered move first
+        if self.move_ordering_hook and not node._moves_ordered:
+            node.untried_moves = self.move_ordering_hook(node.position, node.untried_moves)[::-1]
+            node._moves_ordered = True
+
         # Get move to expand
         move = node.untried_moves.pop()
 
         # Create new position
-        new_position = Board()
-        new_position.copy_from(node.position)
+        new_position = node.position.clone()
         make_move(new_position, move)
 
         # Create child node
         child = MCTSNode(new_position, move, node)
+        child.parent_slot = len(node.children)
         node.children.append(child)
+        node.child_visits.append(0)
+        node.child_value.append(0.0)
 
         return child
 
     def _simulation(self, node: MCTSNode) -> float:
         """Simulation phase: play style-weighted moves to completion."""
-        position = Board()
-        position.copy_from(node.position)
+        # Single scratch board for the whole playout; candidate moves are
+        # scored in place with make/unmake rather than on fresh copies
+        position = node.position.clone()
 
-        # Apply move ordering if hook is provided
         moves = generate_moves(position)
         # Terminal handling: if no legal moves, decide by checkmate/stalemate
         if not moves:
@@ -183,41 +393,46 @@ class MCTSSearch:
             else:
                 # Stalemate -> draw
                 return 0.5
-        if self.move_ordering_hook:
-            moves = self.move_ordering_hook(position, moves)
+        # Bind everything the rollout loop touches to locals once per playout.
+        # The move ordering hook is not applied here: playout moves are sampled,
+        # and sampling probabilities do not depend on list order
+        select_move = self._style_weighted_move_selection
+        evaluate = self._cached_evaluate
+        win_cp = self.rollout_win_cp
+        loss_cp = self.rollout_loss_cp
 
         # Limit simulation depth to prevent infinite loops
         max_depth = 100
         depth = 0
+        score_cp = None
 
         while moves and depth < max_depth:
             # Use style-aware move selection instead of pure random
-            move = self._style_weighted_move_selection(position, moves)
+            move = select_move(position, moves)
             make_move(position, move)
             depth += 1
 
-            moves = generate_moves(position)
-            if self.move_ordering_hook:
-                moves = self.move_ordering_hook(position, moves)
-
-            # Heuristic rollout cutoff: stop if clearly won/lost
-            score_cp = self.evaluator.evaluate(position)
-            if score_cp >= self.rollout_win_cp:
+            # Heuristic rollout cutoff: stop if clearly won/lost. Checked before
+            # generating the next ply's moves so a cutoff skips move generation
+            score_cp = evaluate(position)
+            if score_cp >= win_cp:
                 return 1.0
-            if score_cp <= self.rollout_loss_cp:
+            if score_cp <= loss_cp:
                 return 0.0
 
+            moves = generate_moves(position)
+
         # Return evaluation signal scaled to [0,1] from centipawn score
         # If terminal by lack of moves, prefer checkmate distance by quick probe
         # (simple: if current side to move has no legal moves, treat as win/loss)
-        score_cp = self.evaluator.evaluate(position)
+        # The loop already scored the final position; only evaluate if it never ran
+        if score_cp is None:
+            score_cp = evaluate(position)
         # Optionally could use explain for logging/debug
         # explain = self.evaluator.explain_evaluation(position)
         # Convert to 0..1 win likelihood-ish value
-        # 0 cp -> 0.5; +300 cp -> ~0.73; -300 cp -> ~0.27
-        scale = 300.0
-        value = 1.0 / (1.0 + pow(10.0, -score_cp / scale))
-        return float(value)
+        # 0 cp -> 0.5; +300 cp -> ~0.91; -300 cp -> ~0.09
+        return 1.0 / (1.0 + math.exp(-score_cp * _SIGMOID_K))
 
     def _style_weighted_move_selection(self, position: Board, moves: List[Move]) -> Move:
         """Select a move using style-weighted probability distribution.
@@ -232,100 +447,101 @@ class MCTSSearch:
             return moves[0]
 
         # If no style weights, use uniform random selection
-        if not self.style_weights:
+        if self._uniform:
             return self._rng.choice(moves)
 
-        # Calculate style-weighted scores for each move
+        # Calculate style-weighted scores for each move, applying and
+        # reverting each move on the playout board instead of copying it.
+        # Cache hits are read inline; only misses pay for the method call
+        cache_get = self._eval_cache.get
+        evaluate = self._cached_evaluate
         move_scores = []
         for move in moves:
-            # Create temporary position to evaluate after move
-            temp_position = Board()
-            temp_position.copy_from(position)
-            make_move(temp_position, move)
-
-            # Get evaluation score
-            score = self.evaluator.evaluate(temp_position)
+            undo = make_move(position, move)
+            score = cache_get((position.zobrist, position.halfmove_clock, position.fullmove_number))
+            if score is None:
+                score = evaluate(position)
             move_scores.append(score)
+            unmake_move(position, move, *undo)
 
-        # Convert scores to probabilities using softmax with temperature
+        # Convert scores to softmax weights with temperature, shifted by the
+        # max so exp() cannot overflow
         # Higher temperature = more random, lower temperature = more deterministic
         temperature = 2.0  # Configurable parameter for randomness bounds
-        probabilities = self._softmax(move_scores, temperature)
-
-        # Select move based on weighted probabilities
-        return self._weighted_choice(moves, probabilities)
-
-    def _softmax(self, scores: List[float], temperature: float) -> List[float]:
-        """Convert scores to probabilities using softmax with temperature."""
-        if not scores:
-            return []
-
-        # Apply temperature scaling
-        scaled_scores = [score / temperature for score in scores]
-
-        # Compute softmax
+        scaled_scores = [score / temperature for score in move_scores]
         max_score = max(scaled_scores)
-        exp_scores = [self._exp(score - max_score) for score in scaled_scores]
-        sum_exp = sum(exp_scores)
-
-        if sum_exp == 0:
-            # Fallback to uniform distribution
-            return [1.0 / len(scores) for _ in scores]
-
-        return [exp_score / sum_exp for exp_score in exp_scores]
-
-    def _exp(self, x: float) -> float:
-        """Exponential function with overflow protection."""
-        import math
-
-        # Clamp to prevent overflow
-        x = max(-700, min(700, x))
-        return math.exp(x)
-
-    def _weighted_choice(self, choices: List[Move], probabilities: List[float]) -> Move:
-        """Select a choice based on probability distribution."""
-        if len(choices) != len(probabilities):
-            raise ValueError("Choices and probabilities must have same length")
-
-        # Generate random number between 0 and 1
-        rand_val = self._rng.random()
-
-        # Find the choice corresponding to this random value
-        cumulative = 0.0
-        for choice, prob in zip(choices, probabilities):
-            cumulative += prob
-            if rand_val <= cumulative:
-                return choice
-
-        # Fallback to last choice (shouldn't happen with proper probabilities)
-        return choices[-1]
+        exp = math.exp
+        cum_weights = list(accumulate(exp(score - max_score) for score in scaled_scores))
+
+        # Bisect the unnormalized CDF at one uniform draw scaled by the total
+        # weight; the same draw and lookup random.choices makes, without its
+        # per-call setup, so seeded searches pick identical moves
+        return moves[bisect(cum_weights, self._random() * cum_weights[-1])]
+
+    def _cached_evaluate(self, position: Board) -> float:
+        """Evaluate ``position`` in centipawns, memoized by Zobrist key and move clocks."""
+        cache = self._eval_cache
+        key = (position.zobrist, position.halfmove_clock, position.fullmove_number)
+        score = cache.get(key)
+        if score is None:
+            score = self.evaluator.evaluate(position)
+            if len(cache) >= EVAL_CACHE_SIZE:
+                # Dicts keep insertion order, so this evicts the oldest entry
+                del cache[next(iter(cache))]
+            cache[key] = score
+        return score
 
     def _backpropagation(self, node: MCTSNode, result: float) -> None:
         """Backpropagation phase: update statistics up the tree."""
+        tt_store = self.tt.store
         while node is not None:
             node.visits += 1
             node.value += result
-            # Store aggregate stats in TT for node position
-            try:
-                key = zobrist_hash(node.position)
-                self.tt.store(key, node.visits, node.value)
-            except Exception:
-                pass
-            node = node.parent
+            parent = node.parent
+            if parent is not None:
+                # Keep the parent's per-slot mirror in step for selection
+                parent.child_visits[node.parent_slot] = node.visits
+                parent.child_value[node.parent_slot] = node.value
+            # Publish aggregate stats to the TT every 32 visits; fresh leaves
+            # would only be overwritten, and per-playout writes churn the table
+            if (node.visits & 31) == 0:
+                tt_store(node.zkey, node.visits, node.value)
+            node = parent
+
+
+def _root_worker(
+    fen: str, config: Dict[str, Any], seed: int, playouts: int
+) -> List[Tuple[Tuple[int, int, Optional[str]], int, float]]:
+    """Run one root-parallel search; return (move key, visits, value) per root child."""
+    position = Board()
+    position.load_fen(fen)
+    search = MCTSSearch(max_playouts=playouts, seed=seed, **config)
+    search.search(position)
+    return [
+        (
+            (child.move.from_square, child.move.to_square, child.move.promotion),
+            child.visits,
+            child.value,
+        )
+        for child in search._root.children
+    ]
+
+
+# Capturable piece letters by side to move, and the pieces treated as
+# likely to give check; set membership replaces per-move case checks
+_ENEMY_PIECES = {"w": frozenset("pnbrqk"), "b": frozenset("PNBRQK")}
+_CHECKING_PIECES = frozenset("qrbnQRBN")
 
 
 def heuristic_move_ordering(position: Board, moves: List[Move]) -> List[Move]:
     """Order moves heuristically: captures, checks, promotions first."""
+    squares = position.squares
+    enemy_pieces = _ENEMY_PIECES[position.side_to_move]
 
     def move_priority(move: Move) -> int:
-        # Priority 1: Captures (check if destination has enemy piece)
-        to_piece = position.squares[move.to_square]
-        if to_piece != "\u0000":
-            # Different color pieces
-            if (position.side_to_move == "w" and to_piece.islower()) or (
-                position.side_to_move == "b" and to_piece.isupper()
-            ):
-                return 1
+        # Priority 1: Captures (destination holds an enemy piece)
+        if squares[move.to_square] in enemy_pieces:
+            return 1
 
         # Priority 2: Promotions
         if move.promotion is not None:
@@ -333,8 +549,7 @@ def heuristic_move_ordering(position: Board, moves: List[Move]) -> List[Move]:
 
         # Priority 3: Checks (simplified - would need to check if move gives check)
         # For now, we'll use a basic heuristic
-        from_piece = position.squares[move.from_square]
-        if from_piece.lower() in ["q", "r", "b", "n"]:
+        if squares[move.from_square] in _CHECKING_PIECES:
             return 3
 
         # Priority 4: Other moves
@@ -344,63 +559,77 @@ def heuristic_move_ordering(position: Board, moves: List[Move]) -> List[Move]:
     return sorted(moves, key=move_priority)
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_evaluator(weights_key: tuple) -> Evaluation:
+    """Return a shared evaluator for a canonical (sorted items) style-weight key.
+
+    Built without a position cache: the instance lives as long as the process
+    and orders moves from every game, so a cache would only grow.
+    """
+    return Evaluation(style_weights=dict(weights_key), enable_caching=False)
+
+
 def style_aware_move_ordering(
     position: Board, moves: List[Move], style_weights: Optional[dict] = None
 ) -> List[Move]:
     """Apply style-aware ordering with evaluation-based tie-breaking."""
-    # First apply heuristic ordering
-    ordered_moves = heuristic_move_ordering(position, moves)
-
     # If no style weights provided, return heuristic ordering
     if not style_weights:
-        return ordered_moves
+        return heuristic_move_ordering(position, moves)
 
     # Apply style-aware tie-breaking using evaluation scores
     # Group moves by their heuristic priority and sort within groups by evaluation
-    from eval.heuristics import Evaluation
-
-    evaluator = Evaluation(style_weights=style_weights)
-
-    # Calculate evaluation scores for each move
-    move_evaluations = []
-    for move in ordered_moves:
-        # Create temporary position to evaluate after move
-        temp_position = Board()
-        temp_position.copy_from(position)
-        make_move(temp_position, move)
-
-        # Get evaluation score (from opponent's perspective after the move)
-        score = evaluator.evaluate(temp_position)
-        move_evaluations.append((move, score))
-
-    # Sort by heuristic priority first, then by evaluation score (descending)
-    # Higher evaluation scores are better for the side that just moved
-    def move_key(move_eval_tuple):
-        move, eval_score = move_eval_tuple
-
-        # Get heuristic priority (lower number = higher priority)
-        to_piece = position.squares[move.to_square]
-        priority = 4  # Default priority
-
-        if to_piece != "\u0000":
-            # Different color pieces (capture)
-            if (position.side_to_move == "w" and to_piece.islower()) or (
-                position.side_to_move == "b" and to_piece.isupper()
-            ):
-                priority = 1
-
-        if move.promotion is not None:
-            priority = 2
-
-        from_piece = position.squares[move.from_square]
-        if from_piece.lower() in ["q", "r", "b", "n"]:
+    # Reuse one evaluator per distinct weight set rather than building one per call
+    try:
+        evaluator = _cached_evaluator(tuple(sorted(style_weights.items())))
+    except TypeError:
+        # Unhashable or unorderable weight values; fall back to a one-off evaluator
+        evaluator = Evaluation(style_weights=style_weights)
+
+    # Score every move in one pass: style priority, evaluation and the
+    # heuristic priority are built into a single key, so one sort replaces
+    # the heuristic pre-sort plus regroup. The heuristic priority (and the
+    # sort's stability) breaks ties exactly as the pre-sorted order did.
+    # Evaluation applies the move to `position` and reverts it, so the
+    # caller's board is left unchanged
+    squares = position.squares
+    enemy_pieces = _ENEMY_PIECES[position.side_to_move]
+    evaluate = evaluator.evaluate
+    sort_keys = []
+    for move in moves:
+        is_capture = squares[move.to_square] in enemy_pieces
+        is_promotion = move.promotion is not None
+        is_checker = squares[move.from_square] in _CHECKING_PIECES
+
+        # Style priority (lower number = higher priority); piece type
+        # outranks promotion, which outranks capture
+        if is_checker:
             priority = 3
+        elif is_promotion:
+            priority = 2
+        elif is_capture:
+            priority = 1
+        else:
+            priority = 4
+
+        # Heuristic priority, as in heuristic_move_ordering
+        if is_capture:
+            heuristic = 1
+        elif is_promotion:
+            heuristic = 2
+        elif is_checker:
+            heuristic = 3
+        else:
+            heuristic = 4
 
-        # Return tuple: (priority, -eval_score) for descending evaluation within same priority
-        return (priority, -eval_score)
+        # Evaluation score (from opponent's perspective after the move)
+        undo = make_move(position, move)
+        score = evaluate(position)
+        unmake_move(position, move, *undo)
 
-    # Sort moves by priority first, then by evaluation score
-    sorted_moves = sorted(move_evaluations, key=move_key)
+        # Descending evaluation within the same priority
+        sort_keys.append((priority, -score, heuristic))
 
-    # Extract just the moves in the new order
-    return [move for move, _ in sorted_moves]
+    # Sort move indices by their keys, then gather the moves in that order
+    order = sorted(range(len(moves)), key=sort_keys.__getitem__)
+    return [moves[i] for i in order]
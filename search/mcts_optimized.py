@@ -4,9 +4,13 @@ This module provides performance-optimized MCTS with caching, move ordering,
 and efficient memory management to meet 10,000 nodes/sec targets.
 """
 
+import math
 import random
 import time
+from bisect import bisect_right
+from collections import OrderedDict
 from functools import lru_cache
+from itertools import accumulate
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from core.board import Board
@@ -15,10 +19,25 @@ from eval.heuristics import parse_style_config
 from eval.heuristics_optimized import OptimizedEvaluation as Evaluation
 from performance.profiler import ProfilerContext, profile_function, profile_method
 
+# Maximum number of positions kept in the move ordering cache (LRU eviction)
+MOVE_ORDERING_CACHE_SIZE = 8192
+
 
 class OptimizedMCTSNode:
     """Optimized MCTS node with performance enhancements."""
 
+    # Thousands of nodes are built per search; slots drop the per-node dict
+    __slots__ = (
+        "position",
+        "move",
+        "parent",
+        "visits",
+        "value",
+        "children",
+        "untried_moves",
+        "_legal_moves_generated",
+    )
+
     def __init__(
         self,
         position: Board,
@@ -34,66 +53,33 @@ class OptimizedMCTSNode:
         self.children: List[OptimizedMCTSNode] = []
         self.untried_moves: List[Move] = []
         self._legal_moves_generated = False
-        self._cached_legal_moves: Optional[List[Move]] = None
-
-        # Performance optimizations
-        self._is_terminal_cached: Optional[bool] = None
-        self._is_fully_expanded_cached: Optional[bool] = None
 
     def is_fully_expanded(self) -> bool:
-        """Check if all legal moves have been tried (with caching)."""
-        if self._is_fully_expanded_cached is not None:
-            return self._is_fully_expanded_cached
-
+        """Check if all legal moves have been tried."""
         if not self._legal_moves_generated:
-            self.untried_moves = self._get_legal_moves()
+            self.untried_moves = generate_moves(self.position)
             self._legal_moves_generated = True
-
-        result = len(self.untried_moves) == 0
-        self._is_fully_expanded_cached = result
-        return result
+        return len(self.untried_moves) == 0
 
     def is_terminal(self) -> bool:
-        """Check if this is a terminal node (with caching)."""
-        if self._is_terminal_cached is not None:
-            return self._is_terminal_cached
-
+        """Check if this is a terminal node."""
         if not self._legal_moves_generated:
-            self.untried_moves = self._get_legal_moves()
+            self.untried_moves = generate_moves(self.position)
             self._legal_moves_generated = True
+        return len(self.untried_moves) == 0
 
-        result = len(self.untried_moves) == 0
-        self._is_terminal_cached = result
-        return result
-
-    def _get_legal_moves(self) -> List[Move]:
-        """Get legal moves with caching."""
-        if self._cached_legal_moves is not None:
-            return self._cached_legal_moves
-
-        self._cached_legal_moves = generate_moves(self.position)
-        return self._cached_legal_moves
-
-    def get_ucb_score(self, exploration_constant: float = 1.414) -> float:
-        """Calculate UCB1 score for selection (optimized)."""
+    def get_ucb_score(self, log_parent_visits: float, exploration_constant: float = 1.414) -> float:
+        """Calculate UCB1 score, ``Q/n + C * sqrt(ln(N) / n)``, for selection (optimized)."""
         if self.visits == 0:
             return float("inf")
 
         if self.parent is None:
             return 0.0
 
-        # Optimized UCB1 calculation
         exploitation = self.value / self.visits
-        parent_visits = self.parent.visits
-        exploration = exploration_constant * (2 * (parent_visits**0.5) / self.visits) ** 0.5
+        exploration = exploration_constant * math.sqrt(log_parent_visits / self.visits)
         return exploitation + exploration
 
-    def invalidate_cache(self) -> None:
-        """Invalidate cached values when position changes."""
-        self._is_terminal_cached = None
-        self._is_fully_expanded_cached = None
-        self._cached_legal_moves = None
-
 
 class OptimizedMCTSSearch:
     """Performance-optimized Monte Carlo Tree Search engine."""
@@ -108,8 +94,21 @@ class OptimizedMCTSSearch:
         enable_caching: bool = True,
         enable_move_ordering: bool = True,
         enable_tracing: bool = False,
+        enable_progressive_widening: bool = False,
+        pw_c: float = 1.0,
+        pw_alpha: float = 0.5,
+        batch_size: int = 1,
     ) -> None:
-        """Initialize optimized MCTS with performance features."""
+        """Initialize optimized MCTS with performance features.
+
+        With progressive widening enabled a node exposes at most
+        ``max(1, int(pw_c * visits**pw_alpha))`` children, so playouts deepen
+        the best lines before the remaining moves are expanded.
+
+        ``batch_size`` leaves are selected per iteration (with a virtual visit
+        on each path so the batch spreads over different leaves), simulated
+        together and then backpropagated.
+        """
         self.max_playouts = max_playouts
         self.movetime_ms = movetime_ms
         self.move_ordering_hook = move_ordering_hook
@@ -117,6 +116,10 @@ class OptimizedMCTSSearch:
         self.enable_caching = enable_caching
         self.enable_move_ordering = enable_move_ordering
         self.enable_tracing = enable_tracing
+        self.enable_progressive_widening = enable_progressive_widening
+        self.pw_c = pw_c
+        self.pw_alpha = pw_alpha
+        self.batch_size = max(1, batch_size)
 
         # Profiling context (required by @profile_method decorator)
         self.context = ProfilerContext()
@@ -132,25 +135,67 @@ class OptimizedMCTSSearch:
         self._nodes_processed = 0
         self._start_time = 0.0
 
-        # Move ordering cache
-        self._move_ordering_cache: Dict[str, List[Move]] = {}
+        # Move ordering cache, bounded with least-recently-used eviction
+        self._move_ordering_cache: "OrderedDict[int, List[Move]]" = OrderedDict()
+        self._cache_max = MOVE_ORDERING_CACHE_SIZE
+        self._cache_hits = 0
+        self._cache_misses = 0
 
         # Search tracing (for visualization)
         self._trace_data: Optional[Dict[str, Any]] = None
 
+        # Tree kept between searches; reused when the next search starts from its root
+        self._root: Optional[OptimizedMCTSNode] = None
+
+    @property
+    def root_key(self) -> Optional[int]:
+        """Zobrist key of the retained tree's root, or None without a tree."""
+        return self._root.position.zobrist if self._root is not None else None
+
+    def advance(self, move: Move) -> None:
+        """Re-root the retained tree at the child reached by ``move``.
+
+        Siblings are dropped so their subtrees can be reclaimed. If ``move``
+        was never expanded the tree is discarded.
+        """
+        root = self._root
+        self._root = None
+        if root is None:
+            return
+        for child in root.children:
+            if child.move == move:
+                child.parent = None
+                self._root = child
+                return
+
+    def clear_tree(self) -> None:
+        """Discard the retained tree (e.g. on a new game)."""
+        self._root = None
+
     @profile_method("mcts_search")
     def search(self, position: Board) -> Optional[Move]:
-        """Perform optimized MCTS search and return best move."""
+        """Perform optimized MCTS search and return best move.
+
+        Continues from the retained tree when its root is ``position``, so a
+        repeated call on the same position adds ``max_playouts`` visits to the
+        previous ones and does not reproduce the first call's seeded result;
+        call ``clear_tree()`` first for an independent search.
+        """
         self._start_time = time.perf_counter()
         self._nodes_processed = 0
 
+        # Monotonic clock: deadlines must not move with wall-clock adjustments
         if self.movetime_ms is not None:
-            start_time = time.time()
+            start_time = time.monotonic()
             end_time = start_time + (self.movetime_ms / 1000.0)
         else:
             end_time = None
 
-        root = OptimizedMCTSNode(position)
+        root = self._root
+        reused = root is not None and root.position.zobrist == position.zobrist
+        if not reused:
+            # The tree outlives this call, so it must not share the caller's board
+            root = self._root = OptimizedMCTSNode(position.clone())
 
         # If no legal moves, return None
         if root.is_terminal():
@@ -158,28 +203,35 @@ class OptimizedMCTSSearch:
 
         playouts = 0
 
-        # Pre-order moves at root for better performance
-        if self.enable_move_ordering and self.move_ordering_hook:
+        # Pre-order moves at a fresh root for better performance; a reused root
+        # has already expanded some of its moves
+        if not reused and self.enable_move_ordering and self.move_ordering_hook:
             root.untried_moves = self._order_moves(root.position, root.untried_moves)
 
         while playouts < self.max_playouts:
             # Check time limit if specified
-            if end_time is not None and time.time() >= end_time:
+            if end_time is not None and time.monotonic() >= end_time:
                 break
 
-            # Selection and expansion phase
-            node = self._selection(root)
-            if not node.is_terminal() and not node.is_fully_expanded():
-                node = self._expansion(node)
+            # Selection and expansion phase, one leaf per batch slot
+            leaves = []
+            for _ in range(min(self.batch_size, self.max_playouts - playouts)):
+                node = self._selection(root)
+                if not node.is_terminal() and not node.is_fully_expanded():
+                    node = self._expansion(node)
+                self._add_virtual_visits(node, 1)
+                leaves.append(node)
 
             # Simulation phase
-            result = self._simulation(node)
+            results = self._simulate_batch(leaves)
 
             # Backpropagation phase
-            self._backpropagation(node, result)
+            for node, result in zip(leaves, results):
+                self._add_virtual_visits(node, -1)
+                self._backpropagation(node, result)
 
-            playouts += 1
-            self._nodes_processed += 1
+            playouts += len(leaves)
+            self._nodes_processed += len(leaves)
 
         # Capture trace data if enabled
         if self.enable_tracing:
@@ -195,16 +247,31 @@ class OptimizedMCTSSearch:
     @profile_method("mcts_selection")
     def _selection(self, node: OptimizedMCTSNode) -> OptimizedMCTSNode:
         """Selection phase: traverse tree using UCB1 (optimized)."""
+        widening = self.enable_progressive_widening
         while not node.is_terminal():
-            if not node.is_fully_expanded():
+            if not node.is_fully_expanded() and (
+                not widening
+                or len(node.children) < max(1, int(self.pw_c * node.visits**self.pw_alpha))
+            ):
                 return node
             else:
-                # Use optimized child selection
+                # Score all children in one pass over plain locals; ln(N) is
+                # shared by every sibling, and the first unvisited child
+                # (infinite UCB) wins outright
+                exploration_constant = self.exploration_constant
+                log_parent_visits = math.log(node.visits)
+                sqrt = math.sqrt
                 best_child = None
                 best_score = float("-inf")
 
                 for child in node.children:
-                    score = child.get_ucb_score(self.exploration_constant)
+                    visits = child.visits
+                    if visits == 0:
+                        best_child = child
+                        break
+                    score = child.value / visits + exploration_constant * sqrt(
+                        log_parent_visits / visits
+                    )
                     if score > best_score:
                         best_score = score
                         best_child = child
@@ -221,13 +288,28 @@ class OptimizedMCTSSearch:
             return node
 
         # Select move with move ordering if enabled
-        if self.enable_move_ordering and self.move_ordering_hook:
-            move = self._select_ordered_move(node)
+        untried = node.untried_moves
+        if (
+            self.enable_move_ordering
+            and self.move_ordering_hook
+            and self.enable_progressive_widening
+        ):
+            # Widening exposes few children, so order once and consume best-first
+            # from the end of the list
+            if not node.children:
+                untried = node.untried_moves = self._order_moves(node.position, untried)[::-1]
+            idx = len(untried) - 1
+            move = untried[idx]
+        elif self.enable_move_ordering and self.move_ordering_hook:
+            idx, move = self._select_ordered_move(node)
         else:
-            move = self._rng.choice(node.untried_moves)
+            idx = self._rng.randrange(len(untried))
+            move = untried[idx]
 
-        # Remove selected move from untried moves
-        node.untried_moves.remove(move)
+        # Remove selected move from untried moves: swap with the last entry and
+        # pop, instead of list.remove's scan with Move.__eq__ per element
+        untried[idx] = untried[-1]
+        untried.pop()
 
         # Create new child node
         child_position = self._make_move_copy(node.position, move)
@@ -236,19 +318,41 @@ class OptimizedMCTSSearch:
 
         return child
 
-    def _select_ordered_move(self, node: OptimizedMCTSNode) -> Move:
-        """Select move using move ordering."""
-        if not node.untried_moves:
-            return self._rng.choice(node.untried_moves)
+    def _select_ordered_move(self, node: OptimizedMCTSNode) -> Tuple[int, Move]:
+        """Select move using move ordering.
+
+        Returns the move and its index in ``node.untried_moves``.
+        """
+        untried = node.untried_moves
 
         # Use move ordering hook if available
-        if self.move_ordering_hook:
-            ordered_moves = self.move_ordering_hook(node.position, node.untried_moves)
+        if untried and self.move_ordering_hook:
+            ordered_moves = self.move_ordering_hook(node.position, untried)
             # Select from top moves with some randomness
             top_moves = ordered_moves[: max(1, len(ordered_moves) // 3)]
-            return self._rng.choice(top_moves)
+            move = self._rng.choice(top_moves)
+            # Locate by identity; the hook returns the same Move objects reordered
+            for idx, candidate in enumerate(untried):
+                if candidate is move:
+                    return idx, move
+            return untried.index(move), move
+
+        idx = self._rng.randrange(len(untried))
+        return idx, untried[idx]
+
+    def _add_virtual_visits(self, node: Optional[OptimizedMCTSNode], delta: int) -> None:
+        """Add ``delta`` visits from ``node`` up to the root (virtual loss).
+
+        A pending leaf then looks visited to later selections in the same batch.
+        """
+        while node is not None:
+            node.visits += delta
+            node = node.parent
 
-        return self._rng.choice(node.untried_moves)
+    def _simulate_batch(self, leaves: List[OptimizedMCTSNode]) -> List[float]:
+        """Simulate a batch of leaves, returning one result per leaf."""
+        simulate = self._simulation
+        return [simulate(leaf) for leaf in leaves]
 
     @profile_method("mcts_simulation")
     def _simulation(self, node: OptimizedMCTSNode) -> float:
@@ -257,21 +361,37 @@ class OptimizedMCTSSearch:
         depth = 0
         max_depth = 50  # Prevent infinite playouts
 
-        while depth < max_depth:
-            legal_moves = generate_moves(position)
-            if not legal_moves:
-                # Terminal position - return evaluation
-                return self._evaluate_position(position)
+        # Bind per-ply callees once so the loop skips repeated attribute lookups
+        select_move = self._select_playout_move
 
-            # Style-aware move selection
-            move = self._select_playout_move(position, legal_moves)
+        # Play the rollout in place on the node's board with make_move and
+        # unwind it afterwards, rather than copying the board every ply
+        undo_stack: List[Tuple[Move, tuple]] = []
 
-            # Make move
-            position = self._make_move_copy(position, move)
-            depth += 1
-
-        # Return evaluation of final position
-        return self._evaluate_position(position)
+        # First-ply moves come from the node: generated once and kept as its
+        # untried moves for later expansion, or rebuilt from its expanded children
+        if node._legal_moves_generated:
+            legal_moves = node.untried_moves + [child.move for child in node.children]
+        else:
+            legal_moves = node.untried_moves = generate_moves(position)
+            node._legal_moves_generated = True
+
+        try:
+            while depth < max_depth and legal_moves:
+                # Style-aware move selection
+                move = select_move(position, legal_moves)
+
+                # Make move
+                undo_stack.append((move, make_move(position, move)))
+                depth += 1
+                if depth < max_depth:
+                    legal_moves = generate_moves(position)
+
+            # Terminal or depth-limited: return evaluation of final position
+            return self._evaluate_position(position)
+        finally:
+            for move, undo in reversed(undo_stack):
+                unmake_move(position, move, *undo)
 
     def _select_playout_move(self, position: Board, legal_moves: List[Move]) -> Move:
         """Select move for playout with style influence."""
@@ -280,20 +400,19 @@ class OptimizedMCTSSearch:
 
         # Apply style influence to move selection
         if self.style_weights:
-            # Use evaluation to bias move selection
-            move_scores = []
-            for move in legal_moves:
-                # Quick evaluation of move
-                score = self._quick_evaluate_move(position, move)
-                move_scores.append((move, score))
-
-            # Weight moves by style preferences
-            weighted_moves = []
-            for move, score in move_scores:
-                weight = 1.0 + (score / 1000.0)  # Normalize score
-                weighted_moves.extend([move] * max(1, int(weight)))
+            # Use evaluation to bias move selection; weight = normalized score
+            quick_evaluate = self._quick_evaluate_move
+            cum_weights = list(
+                accumulate(
+                    max(1, int(1.0 + quick_evaluate(position, move) / 1000.0))
+                    for move in legal_moves
+                )
+            )
 
-            return self._rng.choice(weighted_moves)
+            # Sample by bisecting the cumulative weights instead of materializing
+            # each move weight times; randrange(total) picks the same move the
+            # repeated list would have, from the same random draw
+            return legal_moves[bisect_right(cum_weights, self._rng.randrange(cum_weights[-1]))]
 
         return self._rng.choice(legal_moves)
 
@@ -321,11 +440,6 @@ class OptimizedMCTSSearch:
         while node is not None:
             node.visits += 1
             node.value += result
-
-            # Invalidate cache for parent nodes
-            if node.parent:
-                node.parent.invalidate_cache()
-
             node = node.parent
 
     def _evaluate_position(self, position: Board) -> float:
@@ -334,14 +448,8 @@ class OptimizedMCTSSearch:
 
     def _make_move_copy(self, position: Board, move: Move) -> Board:
         """Make a move and return new board position (optimized)."""
-        # Create a copy of the position
-        new_position = Board()
-        new_position.squares = position.squares.copy()
-        new_position.side_to_move = position.side_to_move
-        new_position.castling = position.castling
-        new_position.ep_square = position.ep_square
-        new_position.halfmove_clock = position.halfmove_clock
-        new_position.fullmove_number = position.fullmove_number
+        # Copy the position without running Board.__init__ first
+        new_position = position.clone()
 
         # Apply the move
         make_move(new_position, move)
@@ -354,34 +462,47 @@ class OptimizedMCTSSearch:
             return moves
 
         # Use cached ordering if available
+        cache = self._move_ordering_cache
         position_key = self._get_position_key(position)
-        if position_key in self._move_ordering_cache:
-            return self._move_ordering_cache[position_key]
+        cached = cache.get(position_key)
+        if cached is not None:
+            self._cache_hits += 1
+            cache.move_to_end(position_key)
+            # Callers consume the list in place, so hand out a copy
+            return list(cached)
+        self._cache_misses += 1
 
         # Apply move ordering
         ordered_moves = self.move_ordering_hook(position, moves)
 
-        # Cache the result
+        # Cache the result, evicting the least recently used entry when full
         if self.enable_caching:
-            self._move_ordering_cache[position_key] = ordered_moves
+            cache[position_key] = list(ordered_moves)
+            if len(cache) > self._cache_max:
+                cache.popitem(last=False)
 
         return ordered_moves
 
-    def _get_position_key(self, position: Board) -> str:
+    def _get_position_key(self, position: Board) -> int:
         """Get a key for position caching."""
-        # Simple position key for caching
-        return f"{position.side_to_move}_{hash(tuple(position.squares))}"
+        # Zobrist hash maintained incrementally by the board
+        return position.zobrist
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
         elapsed_time = time.perf_counter() - self._start_time
         nodes_per_second = self._nodes_processed / elapsed_time if elapsed_time > 0 else 0
+        lookups = self._cache_hits + self._cache_misses
+        cache_hit_rate = (self._cache_hits / lookups * 100) if lookups > 0 else 0
 
         return {
             "nodes_processed": self._nodes_processed,
             "elapsed_time": elapsed_time,
             "nodes_per_second": nodes_per_second,
-            "cache_hits": len(self._move_ordering_cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "cache_hit_rate": cache_hit_rate,
+            "cache_size": len(self._move_ordering_cache),
             "target_met": nodes_per_second >= 10000,
         }
 
@@ -1,13 +1,22 @@
 """Lightweight transposition table for MCTS.
 
-Stores aggregate statistics keyed by Zobrist hash. Replacement policy is simple
-bucketed LRU via insertion order within a fixed-size dict.
+Stores aggregate statistics keyed by Zobrist hash in flat typed arrays with
+open addressing: the table size is a power of two, a key's home slot is
+``key & mask``, and up to ``PROBE_LIMIT`` consecutive slots are probed. When
+every probed slot holds another position, the home slot is overwritten
+(always-replace). Key 0 marks an empty slot, so a hash of 0 is stored as 1.
 """
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Optional
+
+# Consecutive slots examined before falling back to replacement
+PROBE_LIMIT = 4
+
+_KEY_MASK = (1 << 64) - 1
 
 
 @dataclass
@@ -18,24 +27,54 @@ class TTEntry:
 
 class TranspositionTable:
     def __init__(self, max_entries: int = 1_000_000) -> None:
-        self._table: Dict[int, TTEntry] = {}
-        self._max = max(1024, max_entries)
+        size = 1
+        while size < max(1024, max_entries):
+            size <<= 1
+        self._mask = size - 1
+        # Parallel arrays: 8 bytes per field per slot, no per-entry objects
+        self._keys = array("Q", bytes(8 * size))
+        self._visits = array("q", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+
+    def _find(self, key: int) -> int:
+        """Return the slot holding ``key``, or -1 if it is not stored."""
+        keys = self._keys
+        mask = self._mask
+        slot = key & mask
+        for _ in range(PROBE_LIMIT):
+            stored = keys[slot]
+            if stored == key:
+                return slot
+            if stored == 0:
+                return -1
+            slot = (slot + 1) & mask
+        return -1
 
     def get(self, key: int) -> Optional[TTEntry]:
-        return self._table.get(key)
+        key = (key & _KEY_MASK) or 1
+        slot = self._find(key)
+        if slot < 0:
+            return None
+        return TTEntry(visits=self._visits[slot], value=self._values[slot])
 
     def store(self, key: int, visits: int, value: float) -> None:
-        if key in self._table:
-            # Merge by summing visits and values
-            entry = self._table[key]
-            entry.visits += visits
-            entry.value += value
-            return
-        if len(self._table) >= self._max:
-            # Evict an arbitrary item (FIFO-ish). For simplicity, pop first key.
-            try:
-                first_key = next(iter(self._table))
-                self._table.pop(first_key, None)
-            except StopIteration:
-                pass
-        self._table[key] = TTEntry(visits=visits, value=value)
+        key = (key & _KEY_MASK) or 1
+        keys = self._keys
+        mask = self._mask
+        slot = key & mask
+        for _ in range(PROBE_LIMIT):
+            stored = keys[slot]
+            if stored == key:
+                # Merge by summing visits and values
+                self._visits[slot] += visits
+                self._values[slot] += value
+                return
+            if stored == 0:
+                break
+            slot = (slot + 1) & mask
+        else:
+            # Probe window full of other positions: replace the home slot
+            slot = key & mask
+        keys[slot] = key
+        self._visits[slot] = visits
+        self._values[slot] = value
@@ -8,15 +8,38 @@ when Cute Chess or Arena are not available.
 """
 
 import os
+import queue
+import re
+import select
 import signal
 import subprocess
 import sys
+import threading
 import time
+import traceback
 from typing import List, Optional, Tuple
 
+# Engine output lines that end a command's response
+_TERMINATOR_RE = re.compile(r"(?i)\b(?:uciok|readyok|bestmove|info)\b")
+
+
+def _extract_bestmove(response: str) -> Optional[str]:
+    """Return the move from the last ``bestmove`` line of ``response``, if any."""
+    for line in reversed(response.splitlines()):
+        if line.lower().startswith("bestmove"):
+            parts = line.split()
+            return parts[1] if len(parts) > 1 else None
+    return None
+
 
 class UCITester:
-    """Test UCI protocol conformance."""
+    """Test UCI protocol conformance.
+
+    One engine process is shared by every test suite: ``start_engine`` spawns
+    it once, the suites never send ``quit``, and ``cleanup`` sends the single
+    ``quit``. Each suite checks the process is still alive first and re-spawns
+    it once if it has died.
+    """
 
     def __init__(self, engine_path: str = None):
         """Initialize tester with engine path."""
@@ -32,26 +55,94 @@ class UCITester:
             self.engine_path = engine_path.split()
 
         self.process = None
+        self._stdin_fd = None
+        self.output_queue = queue.Queue()
+        self.output_thread = None
         self.test_results = []
 
     def start_engine(self) -> bool:
         """Start the UCI engine process."""
         try:
             print(f"Starting engine: {' '.join(self.engine_path)}")
+            self.output_queue = queue.Queue()
+            # Binary pipes; stdout lines are decoded once in the reader thread and
+            # commands are written straight to the stdin descriptor.
+            # stderr is never read, so it is discarded rather than left to fill a pipe
             self.process = subprocess.Popen(
                 self.engine_path,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+                stderr=subprocess.DEVNULL,
             )
-            time.sleep(0.1)  # Give engine time to start
-            return True
+            self._stdin_fd = self.process.stdin.fileno()
+
+            # Start output reader thread
+            self.output_thread = threading.Thread(target=self._read_output, daemon=True)
+            self.output_thread.start()
+
+            return self._handshake()
         except Exception as e:
             print(f"Failed to start engine: {e}")
             return False
 
+    def _write(self, data: bytes) -> None:
+        """Write ``data`` straight to the engine's stdin pipe, bypassing its buffer."""
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self._stdin_fd, view)
+            except BlockingIOError:
+                select.select([], [self._stdin_fd], [], 1.0)
+                continue
+            view = view[written:]
+
+    def _handshake(self, timeout: float = 2.0) -> bool:
+        """Send ``uci`` and wait for ``uciok`` so the engine is known to be ready."""
+        self._write(b"uci\n")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                line = self.output_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if "uciok" in line.lower():
+                return True
+
+        print("Engine did not answer 'uci' with 'uciok'")
+        return False
+
+    def _read_output(self):
+        """Read engine output lines into the queue in a background thread."""
+        try:
+            for raw in iter(self.process.stdout.readline, b""):
+                self.output_queue.put(raw.decode("ascii", "replace").rstrip())
+        except Exception:
+            traceback.print_exc()
+
+    def _ensure_engine(self) -> bool:
+        """Re-spawn the engine once if the shared process has died."""
+        if self.process is not None and self.process.poll() is None:
+            return True
+        print("Engine process is not running; restarting it")
+        return self.start_engine()
+
+    def send_commands_noresp(self, commands: List[str]) -> bool:
+        """Send commands that produce no response in one write, without reading."""
+        if not self.process:
+            return False
+
+        try:
+            print(f"Sending: {'; '.join(commands)}")
+            self._write(("\n".join(commands) + "\n").encode("ascii"))
+            return True
+        except Exception as e:
+            print(f"Error sending commands: {e}")
+            return False
+
     def send_command(self, command: str, timeout: float = 5.0) -> Tuple[bool, str]:
         """Send a command to the engine and get response."""
         if not self.process:
@@ -59,36 +150,26 @@ class UCITester:
 
         try:
             print(f"Sending: {command}")
-            self.process.stdin.write(command + "\n")
-            self.process.stdin.flush()
+            self._write((command + "\n").encode("ascii"))
 
-            # Read response with timeout
-            start_time = time.time()
+            # Collect response lines until a terminator or the deadline
+            deadline = time.monotonic() + timeout
             response_lines = []
 
-            while time.time() - start_time < timeout:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    # Use select to check if data is available
-                    import select
-
-                    if select.select([self.process.stdout], [], [], 0.1)[0]:
-                        line = self.process.stdout.readline()
-                        if line:
-                            response_lines.append(line.strip())
-                            print(f"Received: {line.strip()}")
-
-                            # Check if this looks like a complete response
-                            if any(
-                                keyword in line.lower()
-                                for keyword in ["uciok", "readyok", "bestmove", "info"]
-                            ):
-                                break
-                        else:
-                            break
-                    else:
-                        time.sleep(0.01)
-                except:
-                    time.sleep(0.01)
+                    line = self.output_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                response_lines.append(line)
+                print(f"Received: {line}")
+
+                # Check if this looks like a complete response
+                if _TERMINATOR_RE.search(line):
+                    break
 
             response = "\n".join(response_lines)
             return True, response
@@ -100,13 +181,15 @@ class UCITester:
         """Test basic UCI commands."""
         print("\n=== Testing Basic UCI Commands ===")
 
+        if not self._ensure_engine():
+            return False
+
         tests = [
             ("uci", "uciok"),
             ("isready", "readyok"),
             ("ucinewgame", None),  # No specific response expected
             ("position startpos", None),
             ("go movetime 1000", "bestmove"),
-            ("quit", None),
         ]
 
         all_passed = True
@@ -134,8 +217,11 @@ class UCITester:
         """Test position setup commands."""
         print("\n=== Testing Position Commands ===")
 
+        if not self._ensure_engine():
+            return False
+
         # Reset engine
-        self.send_command("ucinewgame")
+        self.send_commands_noresp(["ucinewgame"])
 
         tests = [
             ("position startpos", None),
@@ -169,9 +255,11 @@ class UCITester:
         """Test search and go commands."""
         print("\n=== Testing Search Commands ===")
 
+        if not self._ensure_engine():
+            return False
+
         # Reset engine
-        self.send_command("ucinewgame")
-        self.send_command("position startpos")
+        self.send_commands_noresp(["ucinewgame", "position startpos"])
 
         tests = [
             ("go movetime 100", "bestmove"),
@@ -202,14 +290,16 @@ class UCITester:
         """Test engine stability with multiple games."""
         print(f"\n=== Testing Stability ({num_games} games) ===")
 
+        if not self._ensure_engine():
+            return False
+
         all_passed = True
 
         for game_num in range(1, num_games + 1):
             print(f"\nGame {game_num}:")
 
             # Reset for new game
-            self.send_command("ucinewgame")
-            self.send_command("position startpos")
+            self.send_commands_noresp(["ucinewgame", "position startpos"])
 
             # Play a few moves
             for move_num in range(1, 6):  # 5 moves per side = 10 half-moves
@@ -223,13 +313,10 @@ class UCITester:
 
                 # Extract move and apply it
                 if "bestmove" in response.lower():
-                    move_line = [
-                        line for line in response.split("\n") if "bestmove" in line.lower()
-                    ]
-                    if move_line:
-                        move = move_line[0].split()[-1]
+                    move = _extract_bestmove(response)
+                    if move:
                         print(f"    Engine played: {move}")
-                        self.send_command(f"position startpos moves {move}")
+                        self.send_commands_noresp([f"position startpos moves {move}"])
                     else:
                         print(f"❌ FAILED: Could not extract move from: {response}")
                         all_passed = False
@@ -247,8 +334,7 @@ class UCITester:
         """Clean up the engine process."""
         if self.process:
             try:
-                self.process.stdin.write("quit\n")
-                self.process.stdin.flush()
+                self._write(b"quit\n")
                 self.process.wait(timeout=2)
             except:
                 self.process.terminate()
@@ -6,73 +6,119 @@ This script tests the UCI engine by running it interactively and sending
 commands one by one, which is closer to how a real GUI would interact.
 """
 
+import os
 import queue
+import re
+import select
 import subprocess
 import sys
 import threading
 import time
+import traceback
+
+# Engine output lines that end a command's response
+_TERMINATOR_RE = re.compile(r"(?i)\b(?:uciok|readyok|bestmove)\b")
+
+
+def _extract_bestmove(response):
+    """Return the move from the last ``bestmove`` line of ``response``, if any."""
+    for line in reversed(response.splitlines()):
+        if line.lower().startswith("bestmove"):
+            parts = line.split()
+            return parts[1] if len(parts) > 1 else None
+    return None
 
 
 class UCITester:
     def __init__(self):
         self.process = None
+        self._stdin_fd = None
         self.output_queue = queue.Queue()
         self.output_thread = None
 
     def start_engine(self):
         """Start the UCI engine."""
         print("Starting UCI engine...")
+        # Binary pipes; stdout lines are decoded once in the reader thread and
+        # commands are written straight to the stdin descriptor.
+        # stderr is never read, so it is discarded rather than left to fill a pipe
         self.process = subprocess.Popen(
             [sys.executable, "-m", "interfaces.uci"],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=0,  # Unbuffered
+            stderr=subprocess.DEVNULL,
         )
+        self._stdin_fd = self.process.stdin.fileno()
 
         # Start output reader thread
         self.output_thread = threading.Thread(target=self._read_output)
         self.output_thread.daemon = True
         self.output_thread.start()
 
-        time.sleep(0.5)  # Give engine time to start
-        return True
+        return self._handshake()
+
+    def _write(self, data):
+        """Write ``data`` straight to the engine's stdin pipe, bypassing its buffer."""
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self._stdin_fd, view)
+            except BlockingIOError:
+                select.select([], [self._stdin_fd], [], 1.0)
+                continue
+            view = view[written:]
+
+    def _handshake(self, timeout=2.0):
+        """Send ``uci`` and wait for ``uciok`` so the engine is known to be ready."""
+        self._write(b"uci\n")
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                response = self.output_queue.get(timeout=0.1)
+                if "uciok" in response.lower():
+                    return True
+            except queue.Empty:
+                continue
+
+        return False
 
     def _read_output(self):
         """Read output from engine in background thread."""
-        while self.process and self.process.poll() is None:
-            try:
-                line = self.process.stdout.readline()
-                if line:
-                    self.output_queue.put(line.strip())
-            except:
-                break
+        try:
+            for line in iter(self.process.stdout.readline, b""):
+                self.output_queue.put(line.decode("ascii", "replace").strip())
+        except Exception:
+            traceback.print_exc()
+
+    def send_commands_noresp(self, commands):
+        """Send commands that produce no response in one write, without reading."""
+        print(f"Sending: {'; '.join(commands)}")
+        self._write(("\n".join(commands) + "\n").encode("ascii"))
 
     def send_command(self, command, timeout=5):
         """Send command and wait for response."""
         print(f"Sending: {command}")
 
-        # Clear any existing output
-        while not self.output_queue.empty():
-            self.output_queue.get()
+        # Clear any existing output in one locked step
+        with self.output_queue.mutex:
+            self.output_queue.queue.clear()
 
         # Send command
-        self.process.stdin.write(command + "\n")
-        self.process.stdin.flush()
+        self._write((command + "\n").encode("ascii"))
 
         # Collect responses
         responses = []
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 response = self.output_queue.get(timeout=0.1)
                 responses.append(response)
                 print(f"Received: {response}")
 
                 # Check if we got a complete response
-                if any(keyword in response.lower() for keyword in ["uciok", "readyok", "bestmove"]):
+                if _TERMINATOR_RE.search(response):
                     break
             except queue.Empty:
                 continue
@@ -114,7 +160,7 @@ class UCITester:
         print("\n=== Testing Position Commands ===")
 
         # Reset
-        self.send_command("ucinewgame")
+        self.send_commands_noresp(["ucinewgame"])
 
         tests = [
             ("position startpos", None),
@@ -142,8 +188,7 @@ class UCITester:
         print("\n=== Testing Search Parameters ===")
 
         # Reset
-        self.send_command("ucinewgame")
-        self.send_command("position startpos")
+        self.send_commands_noresp(["ucinewgame", "position startpos"])
 
         tests = [
             ("go movetime 500", "bestmove"),
@@ -176,8 +221,7 @@ class UCITester:
             print(f"\nGame {game_num}:")
 
             # Reset
-            self.send_command("ucinewgame")
-            self.send_command("position startpos")
+            self.send_commands_noresp(["ucinewgame", "position startpos"])
 
             # Play a few moves
             game_passed = True
@@ -191,11 +235,10 @@ class UCITester:
                     break
 
                 # Extract and apply move
-                move_line = [line for line in response.split("\n") if "bestmove" in line.lower()]
-                if move_line:
-                    move = move_line[0].split()[-1]
+                move = _extract_bestmove(response)
+                if move:
                     print(f"    Engine played: {move}")
-                    self.send_command(f"position startpos moves {move}")
+                    self.send_commands_noresp([f"position startpos moves {move}"])
                 else:
                     print(f"❌ FAILED: Could not extract move")
                     game_passed = False
@@ -213,7 +256,7 @@ class UCITester:
         """Clean up the engine process."""
         if self.process:
             try:
-                self.send_command("quit")
+                self.send_commands_noresp(["quit"])
                 time.sleep(0.5)
                 if self.process.poll() is None:
                     self.process.terminate()
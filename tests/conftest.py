@@ -0,0 +1,23 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from core.board import Board
+
+
+@pytest.fixture(scope="session")
+def startpos_board() -> Board:
+    """The starting position, parsed once per session.
+
+    Shared by every test that requests it, so it must not be mutated; tests
+    that make moves or hand the board to a search use ``fresh_startpos``.
+    """
+    board = Board()
+    board.set_startpos()
+    return board
+
+
+@pytest.fixture
+def fresh_startpos(startpos_board: Board) -> Board:
+    """A private copy of the starting position that may be mutated."""
+    return startpos_board.clone()
@@ -8,7 +8,9 @@ import random
 import unittest
 from typing import Dict, List
 
-from core.board import Board
+import pytest
+
+from core.board import Board, board_from_fen
 from core.moves import Move, generate_moves
 from eval.heuristics import Evaluation, get_style_profile
 from search.mcts import MCTSSearch, style_aware_move_ordering
@@ -35,10 +37,8 @@ class TestStochasticExploration(unittest.TestCase):
             move = search.search(self.board)
             results.append(move)
 
-        # All results should be identical
-        self.assertEqual(
-            len(set(str(r) for r in results)), 1, "Fixed seed should produce deterministic results"
-        )
+        # All results should be identical (Move compares and hashes by value)
+        self.assertEqual(len(set(results)), 1, "Fixed seed should produce deterministic results")
 
     def test_different_seeds_produce_varied_results(self):
         """Test that different seeds produce varied but valid results."""
@@ -57,7 +57,7 @@ class TestStochasticExploration(unittest.TestCase):
             self.assertIsInstance(move, Move)
 
         # Results should show some variation (not all identical)
-        unique_results = len(set(str(r) for r in results))
+        unique_results = len(set(results))
         self.assertGreaterEqual(
             unique_results, 1, "Should have at least some variation with different seeds"
         )
@@ -177,36 +177,36 @@ class TestStyleDifferentiation(unittest.TestCase):
             "Experimental and aggressive styles should produce different evaluations",
         )
 
-    def test_position_specific_style_behaviors(self):
-        """Test each style's characteristic behaviors on specific positions."""
-        positions = [
-            # Tactical position - aggressive should prefer tactical moves
-            ("r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/2N5/PPP2PPP/R1BQKBNR w KQkq - 0 4", "aggressive"),
-            # Quiet position - defensive should prefer solid moves
-            ("rnbqkb1r/pppp1ppp/5n2/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 2 3", "defensive"),
-            # Complex position - experimental should explore alternatives
-            ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", "experimental"),
-        ]
-
-        for fen, expected_style in positions:
-            with self.subTest(position=fen, style=expected_style):
-                board = Board()
-                board.load_fen(fen)
-
-                # Test that the style produces valid evaluation
-                evaluator = Evaluation(style_weights=get_style_profile(expected_style))
-                score = evaluator.evaluate(board)
-
-                # Score should be a valid number
-                self.assertIsInstance(score, (int, float))
-
-                # Test move ordering works
-                moves = generate_moves(board)
-                if moves:
-                    ordered_moves = style_aware_move_ordering(
-                        board, moves, get_style_profile(expected_style)
-                    )
-                    self.assertEqual(len(ordered_moves), len(moves))
+
+# Each case is its own test node, so runners such as pytest-xdist can
+# distribute them across workers
+@pytest.mark.parametrize(
+    "fen,style_name",
+    [
+        # Tactical position - aggressive should prefer tactical moves
+        ("r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/2N5/PPP2PPP/R1BQKBNR w KQkq - 0 4", "aggressive"),
+        # Quiet position - defensive should prefer solid moves
+        ("rnbqkb1r/pppp1ppp/5n2/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 2 3", "defensive"),
+        # Complex position - experimental should explore alternatives
+        ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", "experimental"),
+    ],
+)
+def test_position_specific_style_behaviors(fen: str, style_name: str) -> None:
+    """Test each style's characteristic behaviors on specific positions."""
+    board = board_from_fen(fen)
+
+    # Test that the style produces valid evaluation
+    evaluator = Evaluation(style_weights=get_style_profile(style_name))
+    score = evaluator.evaluate(board)
+
+    # Score should be a valid number
+    assert isinstance(score, (int, float))
+
+    # Test move ordering works
+    moves = generate_moves(board)
+    if moves:
+        ordered_moves = style_aware_move_ordering(board, moves, get_style_profile(style_name))
+        assert len(ordered_moves) == len(moves)
 
 
 class TestBehavioralValidation(unittest.TestCase):
@@ -245,55 +245,51 @@ class TestBehavioralValidation(unittest.TestCase):
             expected_weights = get_style_profile(style)
             self.assertEqual(explanation["style_weights"], expected_weights)
 
-    def test_style_consistency_across_multiple_positions(self):
-        """Test style consistency across multiple positions."""
-        positions = [
-            "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
-            "r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/2N5/PPP2PPP/R1BQKBNR w KQkq - 0 4",
-            "rnbqkb1r/pppp1ppp/5n2/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 2 3",
-        ]
-
-        for style_name in ["aggressive", "defensive", "experimental"]:
-            with self.subTest(style=style_name):
-                style_weights = get_style_profile(style_name)
-
-                for fen in positions:
-                    with self.subTest(position=fen):
-                        board = Board()
-                        board.load_fen(fen)
-
-                        # Evaluation should work consistently
-                        evaluator = Evaluation(style_weights=style_weights)
-                        score = evaluator.evaluate(board)
-                        self.assertIsInstance(score, (int, float))
-
-                        # Move ordering should work consistently
-                        moves = generate_moves(board)
-                        if moves:
-                            ordered = style_aware_move_ordering(board, moves, style_weights)
-                            self.assertEqual(len(ordered), len(moves))
-
-    def test_style_aware_search_depth_and_node_limits(self):
-        """Test style-aware search with different depth and node limits."""
-        board = Board()
-        board.set_startpos()
-
-        style_weights = get_style_profile("aggressive")
-
-        # Test with different limits
-        limits = [
-            {"max_playouts": 50, "seed": 42},
-            {"max_playouts": 100, "seed": 42},
-            {"max_playouts": 200, "movetime_ms": 100, "seed": 42},
-        ]
-
-        for limit_config in limits:
-            with self.subTest(limits=limit_config):
-                search = MCTSSearch(style=style_weights, **limit_config)
-                move = search.search(board)
 
-                # Should return valid move or None
-                self.assertTrue(move is None or isinstance(move, Move))
+@pytest.mark.parametrize("style_name", ["aggressive", "defensive", "experimental"])
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/2N5/PPP2PPP/R1BQKBNR w KQkq - 0 4",
+        "rnbqkb1r/pppp1ppp/5n2/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 2 3",
+    ],
+)
+def test_style_consistency_across_multiple_positions(fen: str, style_name: str) -> None:
+    """Test style consistency across multiple positions."""
+    style_weights = get_style_profile(style_name)
+    board = board_from_fen(fen)
+
+    # Evaluation should work consistently
+    evaluator = Evaluation(style_weights=style_weights)
+    score = evaluator.evaluate(board)
+    assert isinstance(score, (int, float))
+
+    # Move ordering should work consistently
+    moves = generate_moves(board)
+    if moves:
+        ordered = style_aware_move_ordering(board, moves, style_weights)
+        assert len(ordered) == len(moves)
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [
+        {"max_playouts": 50, "seed": 42},
+        {"max_playouts": 100, "seed": 42},
+        {"max_playouts": 200, "movetime_ms": 100, "seed": 42},
+    ],
+)
+def test_style_aware_search_depth_and_node_limits(limits: Dict[str, int]) -> None:
+    """Test style-aware search with different depth and node limits."""
+    board = Board()
+    board.set_startpos()
+
+    search = MCTSSearch(style=get_style_profile("aggressive"), **limits)
+    move = search.search(board)
+
+    # Should return valid move or None
+    assert move is None or isinstance(move, Move)
 
 
 class TestRegressionSafeguards(unittest.TestCase):
@@ -2,7 +2,7 @@
 
 import pytest
 
-from core.board import Board, index_to_square, square_to_index
+from core.board import Board, board_from_fen, index_to_square, square_to_index
 
 
 class TestBoard:
@@ -123,3 +123,29 @@ class TestBoard:
         # Invalid square index (too many pieces in a rank)
         with pytest.raises(ValueError):
             board.load_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNRR w KQkq - 0 1")
+
+    def test_clone_is_independent_copy(self) -> None:
+        """Test that clone copies all state and shares no squares list."""
+        board = Board()
+        board.load_fen("rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2")
+
+        clone = board.clone()
+        assert clone.to_fen() == board.to_fen()
+        assert clone.squares is not board.squares
+
+        clone.squares[square_to_index("e4")] = "\u0000"
+        assert board.squares[square_to_index("e4")] == "P"
+
+    def test_board_from_fen_returns_independent_boards(self) -> None:
+        """Test that boards built from the same FEN share no state."""
+        fen = "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2"
+        first = board_from_fen(fen)
+        second = board_from_fen(fen)
+        assert first is not second
+        assert first.to_fen() == second.to_fen() == fen
+
+        first.squares[square_to_index("e4")] = "\u0000"
+        assert board_from_fen(fen).to_fen() == fen
+
+        with pytest.raises(ValueError):
+            board_from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1")
@@ -6,13 +6,17 @@ These tests verify that the CLI commands work correctly and produce expected out
 import subprocess
 import sys
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from cli.runner import _ascii_board, run_analysis, run_apply_moves, run_perft_test
+from cli.runner import _ascii_board, main, run_analysis, run_apply_moves, run_perft_test
 from core.board import Board
 
+# Repository root, so ``python -m cli.runner`` resolves from any working directory
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
 
 class TestCLI:
     """Test cases for CLI runner functionality."""
@@ -125,81 +129,57 @@ class TestCLI:
             output_str = str(mock_print.call_args_list)
             assert "Skipping malformed move" in output_str
 
-    def test_cli_perft_command(self) -> None:
+    def test_cli_perft_command(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI perft command."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "perft", "1"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["perft", "1"]) == 0
 
-        assert result.returncode == 0
-        assert "Running perft test to depth 1" in result.stdout
-        assert "Perft(1) = 20" in result.stdout
+        out = capsys.readouterr().out
+        assert "Running perft test to depth 1" in out
+        assert "Perft(1) = 20" in out
 
-    def test_cli_perft_command_with_fen(self) -> None:
+    def test_cli_perft_command_with_fen(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI perft command with custom FEN."""
         fen = "8/8/8/8/8/8/8/4K3 w - - 0 1"
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "perft", "1", "--fen", fen],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["perft", "1", "--fen", fen]) == 0
 
-        assert result.returncode == 0
-        assert "Running perft test to depth 1" in result.stdout
-        assert "Perft(1) = 5" in result.stdout
+        out = capsys.readouterr().out
+        assert "Running perft test to depth 1" in out
+        assert "Perft(1) = 5" in out
 
-    def test_cli_analyze_command(self) -> None:
+    def test_cli_analyze_command(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI analyze command."""
         fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "analyze", fen],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["analyze", fen]) == 0
 
-        assert result.returncode == 0
-        assert "Position:" in result.stdout
-        assert "Legal moves: 20" in result.stdout
+        out = capsys.readouterr().out
+        assert "Position:" in out
+        assert "Legal moves: 20" in out
 
-    def test_cli_apply_command(self) -> None:
+    def test_cli_apply_command(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI apply command."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "apply", "e2e4", "e7e5"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["apply", "e2e4", "e7e5"]) == 0
 
-        assert result.returncode == 0
-        assert "P" in result.stdout  # Should contain pieces
-        assert "STM: w" in result.stdout  # White to move after both moves
+        out = capsys.readouterr().out
+        assert "P" in out  # Should contain pieces
+        assert "STM: w" in out  # White to move after both moves
 
-    def test_cli_apply_command_with_fen(self) -> None:
+    def test_cli_apply_command_with_fen(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI apply command with custom FEN."""
         fen = "8/8/8/8/8/8/8/4K3 w - - 0 1"
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "apply", "e1e2", "--fen", fen],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["apply", "e1e2", "--fen", fen]) == 0
 
-        assert result.returncode == 0
-        assert "K" in result.stdout  # Should contain king
-        assert "STM: b" in result.stdout  # Black to move after white move
+        out = capsys.readouterr().out
+        assert "K" in out  # Should contain king
+        assert "STM: b" in out  # Black to move after white move
 
     def test_cli_help_command(self) -> None:
-        """Test CLI help command."""
+        """Test CLI help command end to end through ``python -m``."""
+        # The one subprocess test: covers module execution and the exit status
         result = subprocess.run(
-            ["python", "-m", "cli.runner", "--help"],
+            [sys.executable, "-m", "cli.runner", "--help"],
             capture_output=True,
             text=True,
-            cwd="/home/prab/Zyra",
+            cwd=REPO_ROOT,
         )
 
         assert result.returncode == 0
@@ -210,110 +190,62 @@ class TestCLI:
         assert "play" in result.stdout
         assert "profile-style" in result.stdout
 
-    def test_cli_no_command(self) -> None:
+    def test_cli_no_command(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI with no command specified."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner"], capture_output=True, text=True, cwd="/home/prab/Zyra"
-        )
+        assert main([]) == 0
 
-        assert result.returncode == 0
-        assert "Zyra Chess Engine CLI" in result.stdout
+        assert "Zyra Chess Engine CLI" in capsys.readouterr().out
 
-    def test_cli_perft_depth_0(self) -> None:
+    def test_cli_perft_depth_0(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI perft command with depth 0."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "perft", "0"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["perft", "0"]) == 0
 
-        assert result.returncode == 0
-        assert "Running perft test to depth 0" in result.stdout
-        assert "Perft(0) = 1" in result.stdout
+        out = capsys.readouterr().out
+        assert "Running perft test to depth 0" in out
+        assert "Perft(0) = 1" in out
 
-    def test_cli_perft_depth_2(self) -> None:
+    def test_cli_perft_depth_2(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI perft command with depth 2."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "perft", "2"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["perft", "2"]) == 0
 
-        assert result.returncode == 0
-        assert "Running perft test to depth 2" in result.stdout
-        assert "Perft(2) = 400" in result.stdout
+        out = capsys.readouterr().out
+        assert "Running perft test to depth 2" in out
+        assert "Perft(2) = 400" in out
 
-    def test_cli_apply_illegal_move(self) -> None:
+    def test_cli_apply_illegal_move(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI apply command with illegal move."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "apply", "e2e5"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["apply", "e2e5"]) == 0
 
-        assert result.returncode == 0
-        assert "Ignoring illegal move: e2e5" in result.stdout
+        assert "Ignoring illegal move: e2e5" in capsys.readouterr().out
 
-    def test_cli_apply_malformed_move(self) -> None:
+    def test_cli_apply_malformed_move(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI apply command with malformed move."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "apply", "invalid"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["apply", "invalid"]) == 0
 
-        assert result.returncode == 0
-        assert "Skipping malformed move" in result.stdout
+        assert "Skipping malformed move" in capsys.readouterr().out
 
-    def test_cli_analyze_empty_board(self) -> None:
+    def test_cli_analyze_empty_board(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI analyze command with empty board."""
         fen = "8/8/8/8/8/8/8/8 w - - 0 1"
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "analyze", fen],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["analyze", fen]) == 0
 
-        assert result.returncode == 0
-        assert "Position:" in result.stdout
-        assert "Legal moves: 0" in result.stdout
+        out = capsys.readouterr().out
+        assert "Position:" in out
+        assert "Legal moves: 0" in out
 
-    def test_cli_play_command(self) -> None:
+    def test_cli_play_command(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI play command plays some plies and outputs moves."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "play", "--max-plies", "2"],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["play", "--max-plies", "2"]) == 0
 
-        assert result.returncode == 0
-        assert "Played plies:" in result.stdout
-        assert "Final position:" in result.stdout
+        out = capsys.readouterr().out
+        assert "Played plies:" in out
+        assert "Final position:" in out
 
-    def test_cli_profile_style_command(self) -> None:
+    def test_cli_profile_style_command(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test CLI profile-style command with aggressive profile."""
         fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "cli.runner",
-                "profile-style",
-                fen,
-                "--profile",
-                "aggressive",
-            ],
-            capture_output=True,
-            text=True,
-            cwd="/home/prab/Zyra",
-        )
+        assert main(["profile-style", fen, "--profile", "aggressive"]) == 0
 
-        assert result.returncode == 0
-        assert "Style profile:" in result.stdout
-        assert "Total (cp):" in result.stdout
+        out = capsys.readouterr().out
+        assert "Style profile:" in out
+        assert "Total (cp):" in out
@@ -1,11 +1,11 @@
 """Tests for explainability and reproducibility features."""
 
 import json
-import subprocess
 from typing import Dict
 
 import pytest
 
+from cli.runner import main
 from core.board import Board
 from eval.heuristics import Evaluation, create_evaluator, parse_style_config
 from performance.metrics import RunMetadata, create_run_metadata
@@ -113,33 +113,26 @@ class TestReproducibilityMetadata:
 class TestCLISeedAndMetadata:
     """Test CLI --seed parameter and metadata output."""
 
-    def test_cli_accepts_seed_parameter(self):
+    def test_cli_accepts_seed_parameter(self, capsys):
         """Verify CLI accepts --seed parameter."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "--seed", "12345", "perft", "1"],
-            capture_output=True,
-            text=True,
-        )
-
         # Should not error
-        assert result.returncode == 0
+        assert main(["--seed", "12345", "perft", "1"]) == 0
+
+        out = capsys.readouterr().out
         # Should echo metadata
-        assert "Run Metadata" in result.stdout
-        assert "12345" in result.stdout
+        assert "Run Metadata" in out
+        assert "12345" in out
 
-    def test_cli_prints_metadata_block(self):
+    def test_cli_prints_metadata_block(self, capsys):
         """Verify CLI prints machine-readable metadata block."""
-        result = subprocess.run(
-            ["python", "-m", "cli.runner", "--seed", "42", "perft", "1"],
-            capture_output=True,
-            text=True,
-        )
+        main(["--seed", "42", "perft", "1"])
+        out = capsys.readouterr().out
 
         # Check for metadata markers
-        assert "=== Run Metadata ===" in result.stdout
+        assert "=== Run Metadata ===" in out
 
         # Check it's valid JSON by extracting and parsing
-        lines = result.stdout.split("\n")
+        lines = out.split("\n")
         json_lines = []
         in_json = False
         for line in lines:
@@ -156,23 +149,18 @@ class TestCLISeedAndMetadata:
             metadata = json.loads(json_str)
             assert metadata["seed"] == 42
 
-    def test_cli_profile_style_includes_profile_in_metadata(self):
+    def test_cli_profile_style_includes_profile_in_metadata(self, capsys):
         """Verify profile-style command includes profile name in metadata."""
-        result = subprocess.run(
+        rc = main(
             [
-                "python",
-                "-m",
-                "cli.runner",
                 "--seed",
                 "123",
                 "profile-style",
                 "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
                 "--profile",
                 "aggressive",
-            ],
-            capture_output=True,
-            text=True,
+            ]
         )
 
-        assert result.returncode == 0
-        assert "aggressive" in result.stdout
+        assert rc == 0
+        assert "aggressive" in capsys.readouterr().out
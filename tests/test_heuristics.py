@@ -3,12 +3,11 @@
 import time
 
 from core.board import Board
-from eval.heuristics import Evaluation, get_style_profile, parse_style_config
+from eval.heuristics import Evaluation, get_style_profile, parse_style_config, set_style_profile
 
 
-def test_material_base_values_startpos() -> None:
-    board = Board()
-    board.set_startpos()
+def test_material_base_values_startpos(startpos_board: Board) -> None:
+    board = startpos_board
     ev = Evaluation()
     score = ev.evaluate(board)
     # Startpos should be roughly equal; allow small non-zero due to heuristics
@@ -29,9 +28,8 @@ def test_attacking_motifs_knight_attacks_queen() -> None:
     assert aggr >= plain
 
 
-def test_explain_logging_contains_terms_and_weights() -> None:
-    board = Board()
-    board.set_startpos()
+def test_explain_logging_contains_terms_and_weights(startpos_board: Board) -> None:
+    board = startpos_board
     ev = Evaluation(style_weights=parse_style_config("defensive"))
     explain = ev.explain_evaluation(board)
     assert "total" in explain
@@ -54,6 +52,17 @@ def test_explain_logging_contains_terms_and_weights() -> None:
         assert key in explain["terms"]
 
 
+def test_evaluate_matches_explained_total_after_style_change() -> None:
+    board = Board()
+    board.load_fen("r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/2N5/PPP2PPP/R1BQKBNR w KQkq - 0 4")
+    ev = Evaluation(style_weights=get_style_profile("aggressive"))
+    assert ev.evaluate(board) == ev.explain_evaluation(board)["total"]
+
+    # Cached scores are raw terms, so a runtime style change takes effect
+    set_style_profile(ev, {"material": 0.5, "mobility": 2.0})
+    assert ev.evaluate(board) == ev.explain_evaluation(board)["total"]
+
+
 def test_hanging_piece_penalty_simple() -> None:
     board = Board()
     # White queen unprotected attacked by black knight
@@ -64,9 +73,8 @@ def test_hanging_piece_penalty_simple() -> None:
     assert score < 0
 
 
-def test_evaluation_performance_smoke() -> None:
-    board = Board()
-    board.set_startpos()
+def test_evaluation_performance_smoke(startpos_board: Board) -> None:
+    board = startpos_board
     ev = Evaluation(style_weights=get_style_profile("experimental"))
     start = time.time()
     total = 0.0
@@ -1,22 +1,37 @@
 """Tests for MCTS search implementation."""
 
+import math
 import random
 import time
 import unittest
-from unittest.mock import patch
+from array import array
+from unittest.mock import MagicMock, patch
 
 from core.board import Board
-from core.moves import Move
-from search.mcts import MCTSSearch, heuristic_move_ordering, style_aware_move_ordering
+from core.moves import Move, generate_moves, make_move
+from search.mcts import (
+    MCTSNode,
+    MCTSSearch,
+    _cached_evaluator,
+    _select_ucb_child,
+    heuristic_move_ordering,
+    style_aware_move_ordering,
+)
+from search.mcts_optimized import OptimizedMCTSNode, OptimizedMCTSSearch
 
 
 class TestMCTSDeterminism(unittest.TestCase):
     """Test deterministic behavior with fixed seeds."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Parse the starting position once for the class."""
+        cls.startpos = Board()
+        cls.startpos.set_startpos()
+
     def setUp(self):
-        """Set up test board."""
-        self.board = Board()
-        self.board.set_startpos()
+        """Give each test its own copy of the starting position."""
+        self.board = self.startpos.clone()
 
     def test_deterministic_with_fixed_seed(self):
         """Test that search is deterministic with fixed seed."""
@@ -98,13 +113,99 @@ class TestMCTSDeterminism(unittest.TestCase):
         self.assertTrue(result is None or isinstance(result, Move))
 
 
-class TestMoveOrdering(unittest.TestCase):
-    """Test move ordering functionality."""
+class TestUCBScore(unittest.TestCase):
+    """Test the UCB1 selection formula."""
 
     def setUp(self):
-        """Set up test board."""
+        """Set up a parent node on the start position."""
         self.board = Board()
         self.board.set_startpos()
+        self.parent = MCTSNode(self.board)
+
+    def test_ucb_score_matches_canonical_formula(self):
+        """UCB1 is Q/n + C * sqrt(ln(N) / n)."""
+        self.parent.visits = 20
+        child = MCTSNode(self.board, parent=self.parent)
+        child.visits = 5
+        child.value = 3.0
+
+        # 3/5 + 1.414 * sqrt(ln(20) / 5)
+        score = child.get_ucb_score(math.log(20), 1.414)
+        self.assertAlmostEqual(score, 1.6945003540, places=9)
+
+    def test_unvisited_child_scores_infinity(self):
+        """Unvisited children are always explored first."""
+        child = MCTSNode(self.board, parent=self.parent)
+        self.assertEqual(child.get_ucb_score(math.log(10)), float("inf"))
+
+    def test_selection_picks_highest_ucb_child(self):
+        """Selection agrees with get_ucb_score over the per-slot child stats."""
+        first = MCTSNode(self.board, parent=self.parent)
+        second = MCTSNode(self.board, parent=self.parent)
+        first.visits, first.value = 10, 6.0
+        second.visits, second.value = 2, 1.0
+        self.parent.visits = 12
+        self.parent.children = [first, second]
+        self.parent.child_visits = array("q", [10, 2])
+        self.parent.child_value = array("d", [6.0, 1.0])
+
+        # 0.6 + 1.414 * sqrt(ln(12) / 10) ~= 1.3049 vs 0.5 + 1.414 * sqrt(ln(12) / 2) ~= 2.0761
+        log_parent_visits = math.log(12)
+        self.assertAlmostEqual(first.get_ucb_score(log_parent_visits), 1.3048625693, places=9)
+        self.assertAlmostEqual(second.get_ucb_score(log_parent_visits), 2.0761206197, places=9)
+        self.assertIs(_select_ucb_child(self.parent, 1.414), second)
+
+
+class TestTreeReuse(unittest.TestCase):
+    """Test retaining the search tree between searches."""
+
+    def test_advance_reuses_subtree(self):
+        """Searching after advance continues from the played child."""
+        board = Board()
+        board.set_startpos()
+        search = MCTSSearch(max_playouts=60, seed=42)
+        move = search.search(board)
+
+        search.advance(move)
+        child = search._root
+        self.assertIsNotNone(child)
+        self.assertIsNone(child.parent)
+        prior_visits = child.visits
+
+        make_move(board, move)
+        self.assertEqual(search.root_key, board.zobrist)
+        search.search(board)
+        self.assertIs(search._root, child)
+        self.assertEqual(child.visits, prior_visits + 60)
+
+    def test_clear_tree_and_unknown_position(self):
+        """A cleared tree or a different position starts a fresh root."""
+        board = Board()
+        board.set_startpos()
+        search = MCTSSearch(max_playouts=10, seed=42)
+        search.search(board)
+        search.clear_tree()
+        self.assertIsNone(search.root_key)
+
+        search.search(board)
+        old_root = search._root
+        board.load_fen("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+        search.search(board)
+        self.assertIsNot(search._root, old_root)
+
+
+class TestMoveOrdering(unittest.TestCase):
+    """Test move ordering functionality."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse the starting position once for the class."""
+        cls.startpos = Board()
+        cls.startpos.set_startpos()
+
+    def setUp(self):
+        """Give each test its own copy of the starting position."""
+        self.board = self.startpos.clone()
 
     def test_heuristic_ordering_structure(self):
         """Test that heuristic ordering returns moves in priority order."""
@@ -151,6 +252,19 @@ class TestMoveOrdering(unittest.TestCase):
             self.assertIsInstance(move, Move)
 
 
+    def test_style_aware_ordering_keeps_no_position_cache(self):
+        """The shared ordering evaluator must not retain positions across calls."""
+        style_weights = {"mobility": 1.2}
+        board = self.board
+        for _ in range(3):
+            moves = generate_moves(board)
+            style_aware_move_ordering(board, moves, style_weights)
+            make_move(board, moves[0])
+
+        evaluator = _cached_evaluator(tuple(sorted(style_weights.items())))
+        self.assertEqual(evaluator._evaluation_cache, {})
+
+
 class TestMCTSIntegration(unittest.TestCase):
     """Test MCTS integration with UCI-like interface."""
 
@@ -166,6 +280,41 @@ class TestMCTSIntegration(unittest.TestCase):
         # Should return a valid move or None
         self.assertTrue(result is None or isinstance(result, Move))
 
+    def test_search_initial_ordering_replaces_root_hook(self):
+        """A supplied root ordering is expanded first and skips the hook at the root."""
+        board = Board()
+        board.set_startpos()
+        ordered = heuristic_move_ordering(board, generate_moves(board))
+        hook = MagicMock(side_effect=heuristic_move_ordering)
+        search = MCTSSearch(max_playouts=1, seed=42, move_ordering_hook=hook)
+
+        search.search(board, initial_ordering=ordered)
+
+        self.assertEqual(search._root.children[0].move, ordered[0])
+        hook.assert_not_called()
+
+    def test_search_initial_ordering_applies_to_retained_root(self):
+        """A retained root with unordered moves expands its remaining moves in the given order."""
+        board = Board()
+        board.set_startpos()
+        search = MCTSSearch(max_playouts=1, seed=42)
+        search.search(board)
+        first = search._root.children[0].move
+
+        ordered = [first] + [m for m in generate_moves(board) if m != first][::-1]
+        search.search(board, initial_ordering=ordered)
+
+        self.assertEqual([c.move for c in search._root.children], ordered[:2])
+
+    def test_search_initial_ordering_must_match_root_moves(self):
+        """An ordering that is not the root's legal moves is rejected."""
+        board = Board()
+        board.set_startpos()
+        search = MCTSSearch(max_playouts=1, seed=42)
+
+        with self.assertRaises(ValueError):
+            search.search(board, initial_ordering=generate_moves(board)[1:])
+
     def test_search_parameters(self):
         """Test MCTS with various parameter combinations."""
         board = Board()
@@ -184,6 +333,39 @@ class TestMCTSIntegration(unittest.TestCase):
                 result = search.search(board)
                 self.assertTrue(result is None or isinstance(result, Move))
 
+    def test_search_parallel_returns_legal_move(self):
+        """Root-parallel search merges worker trees into a legal move."""
+        board = Board()
+        board.set_startpos()
+        search = MCTSSearch(max_playouts=20, seed=42, move_ordering_hook=heuristic_move_ordering)
+
+        move = search.search_parallel(board, n_workers=2)
+
+        self.assertIn(move, generate_moves(board))
+
+    def test_evaluation_cached_by_zobrist_key(self):
+        """Repeated evaluations of a position hit the evaluation cache."""
+        board = Board()
+        board.set_startpos()
+        search = MCTSSearch(max_playouts=10, seed=42)
+        expected = search.evaluator.evaluate(board)
+
+        with patch.object(
+            search.evaluator, "evaluate", wraps=search.evaluator.evaluate
+        ) as evaluate:
+            self.assertEqual(search._cached_evaluate(board), expected)
+            self.assertEqual(search._cached_evaluate(board), expected)
+            self.assertEqual(evaluate.call_count, 1)
+
+            # The clocks are part of the key: the evaluator's start-position
+            # fast path depends on them, so the same placement is re-evaluated
+            later = board.clone()
+            later.fullmove_number = 5
+            search._cached_evaluate(later)
+            self.assertEqual(evaluate.call_count, 2)
+        self.assertIn((board.zobrist, 0, 1), search._eval_cache)
+        self.assertIn((board.zobrist, 0, 5), search._eval_cache)
+
     def test_rollout_cutoff_early_exit(self):
         """Heuristic rollout should early-terminate on clear advantage."""
         board = Board()
@@ -195,5 +377,58 @@ class TestMCTSIntegration(unittest.TestCase):
         self.assertTrue(mv is None or isinstance(mv, Move))
 
 
+class TestProgressiveWidening(unittest.TestCase):
+    """Test progressive widening in the optimized search."""
+
+    def setUp(self):
+        """Set up a root with one visited child."""
+        board = Board()
+        board.set_startpos()
+        self.root = OptimizedMCTSNode(board)
+        self.root.is_fully_expanded()
+        move = self.root.untried_moves.pop()
+        self.child = OptimizedMCTSNode(board.clone(), move, self.root)
+        self.root.children.append(self.child)
+        self.root.visits = self.child.visits = 1
+
+    def test_selection_descends_when_widening_limit_reached(self):
+        """A node at its child limit is treated as fully expanded."""
+        search = OptimizedMCTSSearch(seed=42, enable_progressive_widening=True)
+        self.assertIs(search._selection(self.root), self.child)
+
+        # Without widening the root still has untried moves to expand
+        search = OptimizedMCTSSearch(seed=42)
+        self.assertIs(search._selection(self.root), self.root)
+
+    def test_widening_search_returns_move(self):
+        """Widening search with move ordering returns a legal move."""
+        board = Board()
+        board.set_startpos()
+        search = OptimizedMCTSSearch(
+            max_playouts=50,
+            seed=42,
+            move_ordering_hook=heuristic_move_ordering,
+            enable_progressive_widening=True,
+        )
+        self.assertIsInstance(search.search(board), Move)
+
+
+class TestLeafBatching(unittest.TestCase):
+    """Test batched leaf simulation in the optimized search."""
+
+    def test_batched_search_counts_each_playout_once(self):
+        """Virtual visits are reverted and the playout cap is respected."""
+        board = Board()
+        board.set_startpos()
+        search = OptimizedMCTSSearch(max_playouts=37, seed=42, batch_size=8)
+
+        move = search.search(board)
+
+        self.assertIsInstance(move, Move)
+        root = search._root
+        self.assertEqual(root.visits, 37)
+        self.assertTrue(all(child.visits >= 1 for child in root.children))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,9 +4,8 @@ from core.board import Board
 from search.mcts import MCTSSearch
 
 
-def test_mcts_with_style_parameter_runs() -> None:
-    board = Board()
-    board.set_startpos()
+def test_mcts_with_style_parameter_runs(fresh_startpos: Board) -> None:
+    board = fresh_startpos
 
     search = MCTSSearch(max_playouts=50, seed=7, style="aggressive")
     move = search.search(board)
@@ -14,9 +13,8 @@ def test_mcts_with_style_parameter_runs() -> None:
     assert move is not None
 
 
-def test_mcts_explainable_eval_available() -> None:
-    board = Board()
-    board.set_startpos()
+def test_mcts_explainable_eval_available(fresh_startpos: Board) -> None:
+    board = fresh_startpos
 
     search = MCTSSearch(max_playouts=5, seed=1, style="defensive")
     # Run a very small search
@@ -0,0 +1,49 @@
+"""MCTS rollout-rate benchmarks (pytest-benchmark).
+
+Skipped unless the ``pytest-benchmark`` plugin is installed (``pip install -e
+.[dev]``). Record a baseline, then gate later runs on it:
+
+    pytest tests/test_mcts_perf.py --benchmark-only --benchmark-autosave
+    pytest tests/test_mcts_perf.py --benchmark-only \\
+        --benchmark-compare --benchmark-compare-fail=mean:5%
+"""
+
+from typing import Any, Dict, Tuple
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.board import Board
+from eval.heuristics import get_style_profile
+from search.mcts import MCTSSearch
+
+# Playouts per measured search; enough to be dominated by rollouts
+PLAYOUTS = 200
+
+
+def _fresh_search(style_name: str) -> Tuple[Tuple[MCTSSearch, Board], Dict[str, Any]]:
+    """Build an untouched search and start position for one benchmark round.
+
+    Searches keep their tree and evaluation cache between calls, so every
+    round gets a new instance to measure cold playouts.
+    """
+    board = Board()
+    board.set_startpos()
+    search = MCTSSearch(max_playouts=PLAYOUTS, seed=42, style=get_style_profile(style_name))
+    return (search, board), {}
+
+
+def _run_search(search: MCTSSearch, board: Board):
+    return search.search(board)
+
+
+@pytest.mark.parametrize("style_name", ["aggressive", "defensive"])
+def test_rollout_rate(benchmark, style_name: str) -> None:
+    move = benchmark.pedantic(
+        _run_search, setup=lambda: _fresh_search(style_name), rounds=3, iterations=1
+    )
+
+    assert move is not None
+    # Stored with saved runs, so per-round times convert to playouts/second
+    benchmark.extra_info["playouts"] = PLAYOUTS
@@ -5,6 +5,7 @@ import pytest
 from core.board import Board, square_to_index
 from core.moves import (
     Move,
+    clear_move_cache,
     generate_moves,
     get_game_result,
     is_checkmate,
@@ -18,6 +19,7 @@ from core.moves import (
     perft,
     unmake_move,
 )
+from core.zobrist import zobrist_hash
 
 
 class TestMoves:
@@ -165,6 +167,70 @@ class TestMoves:
         # Verify state is restored
         assert board.to_fen() == original_fen
 
+    def test_make_unmake_en_passant(self) -> None:
+        """Test that unmaking an en-passant capture leaves the destination empty."""
+        board = Board()
+        board.load_fen("rnbqkbnr/pppp1ppp/8/3Pp3/8/8/PPP1PPPP/RNBQKBNR w KQkq e6 0 3")
+        original_fen = board.to_fen()
+
+        move = Move(square_to_index("d5"), square_to_index("e6"))
+        undo = make_move(board, move)
+        assert board.squares[square_to_index("e5")] == "\u0000"
+        assert board.squares[square_to_index("e6")] == "P"
+
+        unmake_move(board, move, *undo)
+        assert board.squares[square_to_index("e6")] == "\u0000"
+        assert board.squares[square_to_index("e5")] == "p"
+        assert board.to_fen() == original_fen
+
+    def test_incremental_zobrist_matches_full_hash(self) -> None:
+        """Test that make/unmake keep board.zobrist equal to a full rehash."""
+        board = Board()
+        # Position with castling, en passant and promotion available to white
+        board.load_fen("r3k2r/1P6/8/3Pp3/8/8/8/R3K2R w KQkq e6 0 1")
+        original_hash = board.zobrist
+        assert original_hash == zobrist_hash(board)
+
+        for move in generate_moves(board):
+            undo = make_move(board, move)
+            assert board.zobrist == zobrist_hash(board), move
+            unmake_move(board, move, *undo)
+            assert board.zobrist == original_hash, move
+
+    def test_generate_moves_cached_per_position(self) -> None:
+        """Test that repeated generation returns equal, independent lists."""
+        board = Board()
+        board.load_fen("r3k2r/1P6/8/3Pp3/8/8/8/R3K2R w KQkq e6 0 1")
+
+        first = generate_moves(board)
+        second = generate_moves(board)
+        assert first == second
+        assert first is not second
+
+        # Mutating a returned list must not leak into later calls
+        first.pop()
+        assert generate_moves(board) == second
+
+        # Castling rights are part of the key, so losing them changes the moves
+        board.load_fen("r3k2r/1P6/8/3Pp3/8/8/8/R3K2R w - e6 0 1")
+        assert len(generate_moves(board)) == len(second) - 2
+
+    def test_mobility_side_flip_does_not_poison_move_cache(self) -> None:
+        """Test that scoring mobility keeps the cached moves for the side to move."""
+        from eval.heuristics import _Evaluation_standard
+
+        board = Board()
+        board.load_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1")
+        clear_move_cache()
+
+        # 30 white moves against 20 black replies
+        assert _Evaluation_standard()._score_mobility(board) == 10
+        assert board.to_fen() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+        assert board.zobrist == zobrist_hash(board)
+        moves = generate_moves(board)
+        assert len(moves) == 20
+        assert all(board.squares[m.from_square].islower() for m in moves)
+
     def test_perft_startpos(self) -> None:
         """Test perft counting from starting position."""
         board = Board()
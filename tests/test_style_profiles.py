@@ -3,6 +3,7 @@
 Tests validate the "Distinct Style Personality" requirement from success-metrics spec.
 """
 
+import os
 import unittest
 from typing import Dict, List
 
@@ -25,6 +26,55 @@ def test_styles_produce_different_scores_on_tactical_position() -> None:
     assert not (aggressive == defensive == experimental)
 
 
+def test_style_profiles_are_cached_and_read_only() -> None:
+    aggressive = get_style_profile("aggressive")
+
+    assert get_style_profile("aggressive") is aggressive
+    assert hash(aggressive) == hash(get_style_profile("aggressive"))
+    try:
+        aggressive["material"] = 2.0
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("cached style profile should be read-only")
+    assert aggressive["material"] == 1.0
+
+
+def test_style_outputs_match_committed_baselines() -> None:
+    from tests.baseline_style_outputs import StyleOutputSnapshots
+
+    # Fast mode by default; ZYRA_BASELINE_MODE=full also re-runs the seeded
+    # searches, which must pass before baselines are regenerated or committed
+    snapshots = StyleOutputSnapshots(os.path.join(os.path.dirname(__file__), "baselines"))
+    for style in ("aggressive", "defensive", "experimental"):
+        result = snapshots.validate_against_baseline(style)
+        assert not result["errors"], result["errors"]
+        assert result["mismatches"] == 0, (style, result["mode"], result["details"])
+
+
+def test_create_evaluator_shares_weights_not_evaluators() -> None:
+    from eval.heuristics import create_evaluator
+
+    first = create_evaluator({"mobility": 1.5, "material": 1.0})
+    second = create_evaluator({"material": 1.0, "mobility": 1.5})
+
+    # Same validated weights regardless of key order, but separate evaluators
+    assert first.style_weights is second.style_weights
+    assert first is not second
+    assert create_evaluator({"material": 1.0, "unknown": 2.0}).style_weights == {"material": 1.0}
+
+    # Unhashable values still fall back to uncached validation
+    assert create_evaluator({"material": [1.0]}).style_weights == {}
+
+
+def test_style_profile_cache_is_bounded() -> None:
+    for i in range(100):
+        assert get_style_profile(f"unknown-{i}") == {}
+
+    assert get_style_profile.cache_info().currsize <= 16
+    assert get_style_profile("aggressive")["attacking_motifs"] == 1.3
+
+
 def test_style_weights_validation_ignored_unknown_keys() -> None:
     from eval.heuristics import parse_style_config
 
@@ -86,6 +86,18 @@ class TestUCI:
         assert move_str[2] in "abcdefgh"
         assert move_str[3] in "12345678"
 
+    def test_search_tree_follows_played_moves(self) -> None:
+        """The search tree is re-rooted along position moves and cleared on a new game."""
+        engine = UCIEngine()
+        engine.handle_command("position startpos")
+        best = engine.handle_command("go nodes 50").split()[1]
+
+        engine.handle_command(f"position startpos moves {best}")
+        assert engine.search_engine.root_key == engine.position.zobrist
+
+        engine.handle_command("ucinewgame")
+        assert engine.search_engine.root_key is None
+
     def test_go_command_no_moves(self) -> None:
         """Test go command when no legal moves available."""
         engine = UCIEngine()
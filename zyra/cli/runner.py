@@ -6,6 +6,8 @@ Delegates to the top-level `cli.runner` module.
 from cli.runner import *  # re-export for compatibility
 
 if __name__ == "__main__":
+    import sys
+
     from cli.runner import main
 
-    main()
+    sys.exit(main())